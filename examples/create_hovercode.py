@@ -10,8 +10,6 @@ import argparse
 import json
 from typing import Optional
 
-from hovercode import HovercodeClient
-
 
 def _parse_args() -> argparse.Namespace:
     """Parse CLI arguments for the example script."""
@@ -47,19 +45,20 @@ def main() -> None:
 
     args = _parse_args()
 
-    api_token: Optional[str] = args.api_token
-    client = HovercodeClient(api_token=api_token)
-
-    qr = client.hovercodes.create(
-        workspace=args.workspace,
-        qr_data=args.qr_data,
-        qr_type=args.qr_type,
-        dynamic=True if args.dynamic else None,
-        display_name=args.display_name,
-        primary_color=args.primary_color,
-        generate_png=True if args.generate_png else None,
-    )
+    # Imported after argument parsing so `--help` does not pay for it.
+    from hovercode import HovercodeClient
 
+    api_token: Optional[str] = args.api_token
+    with HovercodeClient(api_token=api_token) as client:
+        qr = client.hovercodes.create(
+            workspace=args.workspace,
+            qr_data=args.qr_data,
+            qr_type=args.qr_type,
+            dynamic=True if args.dynamic else None,
+            display_name=args.display_name,
+            primary_color=args.primary_color,
+            generate_png=True if args.generate_png else None,
+        )
     print(json.dumps(qr, indent=2))
 
 
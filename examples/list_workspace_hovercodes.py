@@ -10,8 +10,6 @@ import argparse
 import json
 from typing import Optional
 
-from hovercode import HovercodeClient
-
 
 def _parse_args() -> argparse.Namespace:
     """Parse CLI arguments for the example script."""
@@ -34,12 +32,15 @@ def main() -> None:
     """Run the example."""
 
     args = _parse_args()
-    api_token: Optional[str] = args.api_token
-    client = HovercodeClient(api_token=api_token)
 
-    payload = client.hovercodes.list_for_workspace(
-        args.workspace_id, q=args.q, page=args.page
-    )
+    # Imported after argument parsing so `--help` does not pay for it.
+    from hovercode import HovercodeClient
+
+    api_token: Optional[str] = args.api_token
+    with HovercodeClient(api_token=api_token) as client:
+        payload = client.hovercodes.list_for_workspace(
+            args.workspace_id, q=args.q, page=args.page
+        )
     print(json.dumps(payload, indent=2))
 
 
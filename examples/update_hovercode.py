@@ -10,8 +10,6 @@ import argparse
 import json
 from typing import Optional
 
-from hovercode import HovercodeClient
-
 
 def _parse_args() -> argparse.Namespace:
     """Parse CLI arguments for the example script."""
@@ -46,15 +44,18 @@ def main() -> None:
     """Run the example."""
 
     args = _parse_args()
-    api_token: Optional[str] = args.api_token
-    client = HovercodeClient(api_token=api_token)
 
-    updated = client.hovercodes.update(
-        args.qr_code_id,
-        qr_data=args.qr_data,
-        display_name=args.display_name,
-        gps_tracking=_parse_bool(args.gps_tracking),
-    )
+    # Imported after argument parsing so `--help` does not pay for it.
+    from hovercode import HovercodeClient
+
+    api_token: Optional[str] = args.api_token
+    with HovercodeClient(api_token=api_token) as client:
+        updated = client.hovercodes.update(
+            args.qr_code_id,
+            qr_data=args.qr_data,
+            display_name=args.display_name,
+            gps_tracking=_parse_bool(args.gps_tracking),
+        )
     print(json.dumps(updated, indent=2))
 
 
@@ -1,15 +1,14 @@
 """Verify a Hovercode webhook signature for a payload file.
 
 Hovercode webhooks include an `X-Signature` header that is an HMAC-SHA256
-signature of the raw request body.
+signature of the raw request body. The payload file is hashed in chunks, so
+large bodies are never loaded into memory at once.
 """
 
 from __future__ import annotations
 
 import argparse
-from pathlib import Path
-
-from hovercode.webhooks import verify_signature_or_raise
+import sys
 
 
 def _parse_args() -> argparse.Namespace:
@@ -36,11 +35,19 @@ def main() -> None:
     """Run the example."""
 
     args = _parse_args()
-    payload = Path(args.payload_path).read_bytes()
 
-    verify_signature_or_raise(
-        secret=args.secret, raw_payload=payload, received_signature=args.signature
-    )
+    # Imported after argument parsing so `--help` does not pay for it.
+    from hovercode.webhooks import verify_signature_stream
+
+    with open(args.payload_path, "rb") as payload_file:
+        valid = verify_signature_stream(
+            secret=args.secret,
+            stream=payload_file,
+            received_signature=args.signature,
+        )
+
+    if not valid:
+        sys.exit("Invalid webhook signature.")
     print("Signature OK")
 
 
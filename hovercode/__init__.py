@@ -2,30 +2,81 @@
 
 This package provides a typed Python client for the Hovercode API, including QR
 code creation, retrieval, updates, tags management, and activity tracking.
+
+Public names are re-exported lazily (PEP 562): the defining module is imported on
+first attribute access, so `import hovercode` stays cheap for callers that only
+need an enum, an exception type, or `__version__`.
 """
 
 from __future__ import annotations
 
-from hovercode.client import HovercodeClient
-from hovercode.enums import ErrorCorrection, EyeStyle, Frame, Pattern, QrType
-from hovercode.exceptions import (
-    ApiError,
-    AuthenticationError,
-    NetworkError,
-    NotFoundError,
-    RateLimitError,
-    ServerError,
-    ValidationError,
-    WebhookSignatureError,
-)
-from hovercode.hovercodes import HovercodesClient
-from hovercode.models import PaginatedResponse, TagInput
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from hovercode.async_client import AsyncBaseClient
+    from hovercode.client import HovercodeClient
+    from hovercode.enums import ErrorCorrection, EyeStyle, Frame, Pattern, QrType
+    from hovercode.exceptions import (
+        ApiError,
+        AuthenticationError,
+        BatchError,
+        NetworkError,
+        NotFoundError,
+        RateLimitError,
+        ServerError,
+        ValidationError,
+        WebhookSignatureError,
+    )
+    from hovercode.hovercodes import HovercodesClient
+    from hovercode.models import PaginatedResponse, TagInput
 
 __version__ = "0.1.1"
 
+_LAZY_EXPORTS = {
+    "ApiError": "hovercode.exceptions",
+    "AsyncBaseClient": "hovercode.async_client",
+    "AuthenticationError": "hovercode.exceptions",
+    "BatchError": "hovercode.exceptions",
+    "ErrorCorrection": "hovercode.enums",
+    "EyeStyle": "hovercode.enums",
+    "Frame": "hovercode.enums",
+    "HovercodeClient": "hovercode.client",
+    "HovercodesClient": "hovercode.hovercodes",
+    "NetworkError": "hovercode.exceptions",
+    "NotFoundError": "hovercode.exceptions",
+    "PaginatedResponse": "hovercode.models",
+    "Pattern": "hovercode.enums",
+    "QrType": "hovercode.enums",
+    "RateLimitError": "hovercode.exceptions",
+    "ServerError": "hovercode.exceptions",
+    "TagInput": "hovercode.models",
+    "ValidationError": "hovercode.exceptions",
+    "WebhookSignatureError": "hovercode.exceptions",
+}
+
+# Submodules that were importable as attributes of the package before the
+# re-exports became lazy (e.g. `hovercode.exceptions.ApiError` after a bare
+# `import hovercode`).
+_SUBMODULES = frozenset(
+    {
+        "async_client",
+        "base_client",
+        "client",
+        "enums",
+        "exceptions",
+        "hovercodes",
+        "models",
+        "types",
+        "webhooks",
+    }
+)
+
 __all__ = [
     "ApiError",
+    "AsyncBaseClient",
     "AuthenticationError",
+    "BatchError",
     "ErrorCorrection",
     "EyeStyle",
     "Frame",
@@ -43,3 +94,33 @@ __all__ = [
     "WebhookSignatureError",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Resolve a lazily re-exported public name.
+
+    Args:
+        name: Attribute name being accessed on the package.
+
+    Returns:
+        The public object defined in the owning submodule, or the submodule
+        itself when `name` is one of the package's submodules.
+
+    Raises:
+        AttributeError: If `name` is neither a public export nor a submodule.
+    """
+
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including lazily re-exported names."""
+
+    return sorted(set(globals()) | set(_LAZY_EXPORTS) | _SUBMODULES)
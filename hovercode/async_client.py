@@ -0,0 +1,411 @@
+"""Asynchronous HTTP transport for the Hovercode API."""
+
+from __future__ import annotations
+
+import asyncio
+from types import TracebackType
+from typing import TYPE_CHECKING, Optional
+
+from hovercode.base_client import (
+    _decode_json,
+    _join_url,
+    _parse_retry_after,
+    _TransportConfig,
+)
+from hovercode.exceptions import NetworkError
+from hovercode.types import JsonValue
+
+if TYPE_CHECKING:
+    from typing import Mapping, Sequence, Union
+
+    import httpx
+    from typing_extensions import Self
+
+    # `httpx` does not accept `bytes` query values, unlike `requests`.
+    AsyncQueryParamScalar = Union[str, int, float]
+    AsyncQueryParams = Mapping[
+        str, Union[AsyncQueryParamScalar, None, Sequence[AsyncQueryParamScalar]]
+    ]
+
+
+class AsyncBaseClient(_TransportConfig):
+    """Asynchronous HTTP transport: the async counterpart of `BaseClient`.
+
+    This client is backed by `httpx.AsyncClient` (HTTP/2, pooled keep-alive
+    connections) and shares configuration, retry/backoff, JSON decoding, and error
+    mapping semantics with the synchronous `BaseClient`. It exposes only the HTTP
+    verbs, not the `HovercodesClient` domain methods: endpoints are the same
+    relative paths those methods use (e.g. `hovercode/{qr_code_id}/`), and
+    responses are returned as parsed JSON without shape checks.
+
+    Requires the optional `httpx` extra: `pip install 'hovercode[httpx]'`.
+
+    Example:
+        ```python
+        import asyncio
+
+        from hovercode import AsyncBaseClient
+
+
+        async def main() -> None:
+            async with AsyncBaseClient() as client:
+                first, second = await asyncio.gather(
+                    client.get("hovercode/QR-CODE-ID-1/"),
+                    client.get("hovercode/QR-CODE-ID-2/"),
+                )
+
+
+        asyncio.run(main())
+        ```
+
+    Args:
+        api_token: Hovercode API token. If not provided, `HOVERCODE_API_TOKEN`
+            is used.
+        base_url: Base URL for the API. Defaults to `https://hovercode.com/api/v2`.
+        timeout_seconds: Per-request timeout in seconds. If not provided,
+            `HOVERCODE_TIMEOUT_SECONDS` is used (or defaults to 10.0).
+        max_retries: Maximum number of retries for transient failures. If not
+            provided, `HOVERCODE_MAX_RETRIES` is used (or defaults to 3).
+        retry_backoff_seconds: Base backoff duration (seconds) used for
+            exponential backoff between retries. If not provided,
+            `HOVERCODE_RETRY_BACKOFF_SECONDS` is used (or defaults to 0.5).
+        client: Optional pre-configured `httpx.AsyncClient` (useful for tests).
+            When omitted, an HTTP/2 client with up to 32 connections (16 kept
+            alive) is created.
+
+    Raises:
+        AuthenticationError: If no API token is provided and the environment
+            variable is missing.
+        ImportError: If `httpx` is not installed and no `client` is provided.
+    """
+
+    _DEFAULT_BASE_URL = "https://hovercode.com/api/v2"
+    _MAX_CONNECTIONS = 32
+    _MAX_KEEPALIVE_CONNECTIONS = 16
+
+    def __init__(
+        self,
+        *,
+        api_token: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout_seconds: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        retry_backoff_seconds: Optional[float] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        resolved_token = self._configure(
+            api_token=api_token,
+            base_url=base_url or self._DEFAULT_BASE_URL,
+            timeout_seconds=timeout_seconds,
+            max_retries=max_retries,
+            retry_backoff_seconds=retry_backoff_seconds,
+        )
+
+        if client is None:
+            try:
+                import httpx
+            except ImportError as exc:  # pragma: no cover
+                raise ImportError(
+                    "httpx is not installed. Install with: "
+                    "pip install 'hovercode[httpx]'"
+                ) from exc
+
+            client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=self._MAX_CONNECTIONS,
+                    max_keepalive_connections=self._MAX_KEEPALIVE_CONNECTIONS,
+                ),
+            )
+        self._client = client
+        self._client.headers.update(
+            {
+                "Accept": "application/json",
+                "Authorization": f"Token {resolved_token}",
+            }
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+
+        await self._client.aclose()
+
+    async def __aenter__(self) -> Self:
+        """Enter a context that closes the client on exit."""
+
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the client when leaving the context."""
+
+        await self.aclose()
+
+    async def get(
+        self,
+        endpoint: str,
+        *,
+        params: Optional[AsyncQueryParams] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> JsonValue:
+        """Send a GET request.
+
+        Args:
+            endpoint: Relative API endpoint.
+            params: Optional query parameters.
+            timeout_seconds: Optional per-request timeout override.
+
+        Returns:
+            Parsed response payload (JSON decoded), or raw text when JSON decoding
+            fails. For `204 No Content`, returns `{}`.
+
+        Raises:
+            ApiError: For non-2xx responses (mapped to more specific subclasses).
+            NetworkError: For transport exceptions after exhausting retries.
+        """
+
+        return await self._request(
+            "GET", endpoint, params=params, timeout_seconds=timeout_seconds
+        )
+
+    async def post(
+        self,
+        endpoint: str,
+        *,
+        params: Optional[AsyncQueryParams] = None,
+        json_data: Optional[JsonValue] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> JsonValue:
+        """Send a POST request.
+
+        Args:
+            endpoint: Relative API endpoint.
+            params: Optional query parameters.
+            json_data: Optional JSON-serializable payload.
+            timeout_seconds: Optional per-request timeout override.
+
+        Returns:
+            Parsed response payload (JSON decoded), or raw text when JSON decoding
+            fails. For `204 No Content`, returns `{}`.
+
+        Raises:
+            ApiError: For non-2xx responses (mapped to more specific subclasses).
+            NetworkError: For transport exceptions after exhausting retries.
+        """
+
+        return await self._request(
+            "POST",
+            endpoint,
+            params=params,
+            json_data=json_data,
+            timeout_seconds=timeout_seconds,
+        )
+
+    async def put(
+        self,
+        endpoint: str,
+        *,
+        params: Optional[AsyncQueryParams] = None,
+        json_data: Optional[JsonValue] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> JsonValue:
+        """Send a PUT request.
+
+        Args:
+            endpoint: Relative API endpoint.
+            params: Optional query parameters.
+            json_data: Optional JSON-serializable payload.
+            timeout_seconds: Optional per-request timeout override.
+
+        Returns:
+            Parsed response payload (JSON decoded), or raw text when JSON decoding
+            fails. For `204 No Content`, returns `{}`.
+
+        Raises:
+            ApiError: For non-2xx responses (mapped to more specific subclasses).
+            NetworkError: For transport exceptions after exhausting retries.
+        """
+
+        return await self._request(
+            "PUT",
+            endpoint,
+            params=params,
+            json_data=json_data,
+            timeout_seconds=timeout_seconds,
+        )
+
+    async def patch(
+        self,
+        endpoint: str,
+        *,
+        params: Optional[AsyncQueryParams] = None,
+        json_data: Optional[JsonValue] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> JsonValue:
+        """Send a PATCH request.
+
+        Args:
+            endpoint: Relative API endpoint.
+            params: Optional query parameters.
+            json_data: Optional JSON-serializable payload.
+            timeout_seconds: Optional per-request timeout override.
+
+        Returns:
+            Parsed response payload (JSON decoded), or raw text when JSON decoding
+            fails. For `204 No Content`, returns `{}`.
+
+        Raises:
+            ApiError: For non-2xx responses (mapped to more specific subclasses).
+            NetworkError: For transport exceptions after exhausting retries.
+        """
+
+        return await self._request(
+            "PATCH",
+            endpoint,
+            params=params,
+            json_data=json_data,
+            timeout_seconds=timeout_seconds,
+        )
+
+    async def delete(
+        self,
+        endpoint: str,
+        *,
+        params: Optional[AsyncQueryParams] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> JsonValue:
+        """Send a DELETE request.
+
+        Args:
+            endpoint: Relative API endpoint.
+            params: Optional query parameters.
+            timeout_seconds: Optional per-request timeout override.
+
+        Returns:
+            Parsed response payload (JSON decoded), or raw text when JSON decoding
+            fails. For `204 No Content`, returns `{}`.
+
+        Raises:
+            ApiError: For non-2xx responses (mapped to more specific subclasses).
+            NetworkError: For transport exceptions after exhausting retries.
+        """
+
+        return await self._request(
+            "DELETE", endpoint, params=params, timeout_seconds=timeout_seconds
+        )
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        params: Optional[AsyncQueryParams] = None,
+        json_data: Optional[JsonValue] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> JsonValue:
+        """Send an HTTP request with retries and error handling.
+
+        Args:
+            method: HTTP method (e.g. GET, POST).
+            endpoint: Relative API endpoint path.
+            params: Optional query parameters. `None` values are omitted, matching
+                `requests`.
+            json_data: Optional JSON-serializable payload.
+            timeout_seconds: Optional per-request timeout override.
+
+        Returns:
+            Parsed response payload (JSON decoded), or raw text when JSON decoding
+            fails. For `204 No Content`, returns `{}`.
+
+        Raises:
+            ApiError: For non-2xx responses (mapped to more specific subclasses).
+            NetworkError: For transport exceptions after exhausting retries.
+        """
+
+        from httpx import RequestError
+
+        url = _join_url(self._base_url, endpoint)
+        timeout = (
+            timeout_seconds if timeout_seconds is not None else self._timeout_seconds
+        )
+        query = (
+            {key: value for key, value in params.items() if value is not None}
+            if params
+            else None
+        )
+
+        for attempt in range(self._max_retries + 1):
+            try:
+                response = await self._client.request(
+                    method,
+                    url,
+                    params=query,
+                    json=json_data,
+                    timeout=timeout,
+                )
+            except RequestError as exc:
+                if attempt < self._max_retries:
+                    await self._sleep_backoff(attempt)
+                    continue
+                raise NetworkError(
+                    message=f"Network error calling {method} {url}: {exc!s}",
+                    status_code=None,
+                    response_data=None,
+                ) from exc
+
+            if (
+                response.status_code in self._RETRYABLE_STATUS_CODES
+                and attempt < self._max_retries
+            ):
+                await self._sleep_backoff(
+                    attempt, _parse_retry_after(response.headers.get("Retry-After"))
+                )
+                continue
+
+            response_data = self._parse_response_data(response)
+            if 200 <= response.status_code < 300:
+                return response_data
+
+            raise self._map_http_error(response.status_code, response_data, method, url)
+
+        raise NetworkError(  # pragma: no cover
+            message=(  # pragma: no cover
+                f"Unexpected retry loop exit for {method} {url}"  # pragma: no cover
+            ),  # pragma: no cover
+            status_code=None,  # pragma: no cover
+            response_data=None,  # pragma: no cover
+        )  # pragma: no cover
+
+    async def _sleep_backoff(
+        self, attempt: int, retry_after: Optional[float] = None
+    ) -> None:
+        """Sleep (without blocking the event loop) per the backoff schedule.
+
+        Args:
+            attempt: Attempt index (0-based) for computing backoff.
+            retry_after: Optional server-provided delay hint (seconds).
+        """
+
+        await asyncio.sleep(self._backoff_delay(attempt, retry_after))
+
+    def _parse_response_data(self, response: httpx.Response) -> JsonValue:
+        """Parse response payload into JSON (preferred) or raw text.
+
+        Args:
+            response: HTTP response.
+
+        Returns:
+            Parsed JSON payload, raw text, or `{}` for 204 responses.
+        """
+
+        if response.status_code == 204:
+            return {}
+
+        try:
+            return _decode_json(response.content, response.json)
+        except ValueError:
+            return response.text
@@ -3,20 +3,13 @@
 from __future__ import annotations
 
 import os
+import re
 import time
-from typing import (
-    Iterable,
-    Mapping,
-    Optional,
-    Protocol,
-    Sequence,
-    Tuple,
-    TypeVar,
-    Union,
-    cast,
-)
-
-import requests
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from types import MappingProxyType, TracebackType
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import urlsplit
 
 from hovercode.exceptions import (
     ApiError,
@@ -29,31 +22,213 @@ from hovercode.exceptions import (
 )
 from hovercode.types import JsonValue
 
-QueryParamScalar = Union[str, bytes, int, float]
-QueryParamValue = Union[QueryParamScalar, None, Sequence[QueryParamScalar]]
-QueryParams = Mapping[str, QueryParamValue]
+if TYPE_CHECKING:
+    from typing import (
+        Callable,
+        Iterable,
+        Mapping,
+        Protocol,
+        Sequence,
+        Tuple,
+        TypeVar,
+        Union,
+    )
+
+    import requests
+    from typing_extensions import Self
+
+    # Annotation-only aliases: never evaluated at runtime.
+    QueryParamScalar = Union[str, bytes, int, float]
+    QueryParamValue = Union[QueryParamScalar, None, Sequence[QueryParamScalar]]
+    QueryParams = Mapping[str, QueryParamValue]
+
+    TRead = TypeVar("TRead", covariant=True)
+
+    class SupportsRead(Protocol[TRead]):
+        """Protocol for file-like objects accepted by requests."""
+
+        def read(self, n: int = ...) -> TRead:
+            """Read up to n bytes/chars from the underlying stream."""
+
+    FileData = Union[SupportsRead[Union[str, bytes]], str, bytes]
+    FileValue = Union[
+        FileData,
+        Tuple[Optional[str], FileData],
+        Tuple[Optional[str], FileData, str],
+        Tuple[Optional[str], FileData, str, Mapping[str, str]],
+    ]
+    Files = Union[Mapping[str, FileValue], Iterable[Tuple[str, FileValue]]]
+
+_fast_json_loads: Optional[Callable[[bytes], JsonValue]]
+try:
+    from orjson import loads as _fast_json_loads
+except ImportError:  # pragma: no cover - exercised only without the extra
+    _fast_json_loads = None
+
+# orjson turns integers outside the 64-bit range into floats instead of raising,
+# so bodies containing a run of 19+ digits are decoded by the stdlib instead.
+_LONG_DIGIT_RUN = re.compile(rb"\d{19}")
+
+# Error payload keys checked, in order, for a human-readable message.
+_ERROR_MESSAGE_KEYS = ("detail", "error", "message")
+
+
+class _TransportConfig:
+    """Configuration, backoff, and error mapping shared by the HTTP transports."""
+
+    _API_TOKEN_ENV_VAR = "HOVERCODE_API_TOKEN"  # nosec B105
+    _ENV_PREFIX = "HOVERCODE"
+    _RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    _MAX_RETRY_AFTER_SECONDS = 60.0
+
+    _base_url: str
+    _timeout_seconds: float
+    _max_retries: int
+    _retry_backoff_seconds: float
+
+    def _configure(
+        self,
+        *,
+        api_token: Optional[str],
+        base_url: str,
+        timeout_seconds: Optional[float],
+        max_retries: Optional[int],
+        retry_backoff_seconds: Optional[float],
+    ) -> str:
+        """Resolve transport settings from arguments and the environment.
+
+        Returns:
+            The resolved API token.
+
+        Raises:
+            AuthenticationError: If no API token is provided and the environment
+                variable is missing.
+            ValidationError: If `base_url` is empty.
+        """
+
+        if not base_url:
+            raise ValidationError("base_url must be a non-empty string.")
+
+        resolved_token = api_token or os.getenv(self._API_TOKEN_ENV_VAR)
+        if not resolved_token:
+            raise AuthenticationError(
+                f"Missing Hovercode API token. Provide api_token= or set "
+                f"{self._API_TOKEN_ENV_VAR}."
+            )
+
+        self._base_url = base_url.rstrip("/")
+        self._timeout_seconds = (
+            timeout_seconds
+            if timeout_seconds is not None
+            else self._get_env_float("TIMEOUT_SECONDS", default=10.0)
+        )
+        self._max_retries = (
+            max_retries
+            if max_retries is not None
+            else self._get_env_int("MAX_RETRIES", default=3)
+        )
+        self._retry_backoff_seconds = (
+            retry_backoff_seconds
+            if retry_backoff_seconds is not None
+            else self._get_env_float("RETRY_BACKOFF_SECONDS", default=0.5)
+        )
+        return resolved_token
+
+    def _backoff_delay(
+        self, attempt: int, retry_after: Optional[float] = None
+    ) -> float:
+        """Compute the delay before the next retry attempt.
 
-TRead = TypeVar("TRead", covariant=True)
+        Args:
+            attempt: Attempt index (0-based) for computing backoff.
+            retry_after: Optional server-provided delay hint (seconds), e.g. from
+                a `Retry-After` header. The longer of the hint (capped at
+                `_MAX_RETRY_AFTER_SECONDS`) and the backoff delay is used.
+
+        Returns:
+            The delay in seconds.
+        """
+
+        delay: float = self._retry_backoff_seconds * (2**attempt)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self._MAX_RETRY_AFTER_SECONDS))
+        return delay
+
+    def _map_http_error(
+        self, status_code: int, response_data: object, method: str, url: str
+    ) -> ApiError:
+        """Map an HTTP error response to an exception type."""
+
+        message = self._extract_error_message(status_code, response_data, method, url)
+        if status_code == 400:
+            return ValidationError(
+                message=message, status_code=status_code, response_data=response_data
+            )
+        if status_code == 401:
+            return AuthenticationError(
+                message=message, status_code=status_code, response_data=response_data
+            )
+        if status_code == 404:
+            return NotFoundError(
+                message=message, status_code=status_code, response_data=response_data
+            )
+        if status_code == 429:
+            return RateLimitError(
+                message=message, status_code=status_code, response_data=response_data
+            )
+        if 500 <= status_code <= 599:
+            return ServerError(
+                message=message, status_code=status_code, response_data=response_data
+            )
+        return ApiError(
+            message=message, status_code=status_code, response_data=response_data
+        )
 
+    def _extract_error_message(
+        self, status_code: int, response_data: object, method: str, url: str
+    ) -> str:
+        """Try to derive a useful error message from an error payload."""
 
-class SupportsRead(Protocol[TRead]):
-    """Protocol for file-like objects accepted by requests."""
+        if isinstance(response_data, dict):
+            for key in _ERROR_MESSAGE_KEYS:
+                value = response_data.get(key)
+                if isinstance(value, str) and value and not value.isspace():
+                    return f"{method} {url} failed ({status_code}): {value}"
+            return f"{method} {url} failed ({status_code})."
 
-    def read(self, n: int = ...) -> TRead:
-        """Read up to n bytes/chars from the underlying stream."""
+        if (
+            isinstance(response_data, str)
+            and response_data
+            and not response_data.isspace()
+        ):
+            return f"{method} {url} failed ({status_code}): {response_data}"
 
+        return f"{method} {url} failed ({status_code})."
 
-FileData = Union[SupportsRead[Union[str, bytes]], str, bytes]
-FileValue = Union[
-    FileData,
-    Tuple[Optional[str], FileData],
-    Tuple[Optional[str], FileData, str],
-    Tuple[Optional[str], FileData, str, Mapping[str, str]],
-]
-Files = Union[Mapping[str, FileValue], Iterable[Tuple[str, FileValue]]]
+    def _get_env_float(self, suffix: str, *, default: float) -> float:
+        """Read and parse a float from an env var, with safe fallback."""
 
+        raw = os.getenv(f"{self._ENV_PREFIX}_{suffix}")
+        if raw is None:
+            return default
+        try:
+            return float(raw)
+        except ValueError:
+            return default
 
-class BaseClient:
+    def _get_env_int(self, suffix: str, *, default: int) -> int:
+        """Read and parse an int from an env var, with safe fallback."""
+
+        raw = os.getenv(f"{self._ENV_PREFIX}_{suffix}")
+        if raw is None:
+            return default
+        try:
+            return int(raw)
+        except ValueError:
+            return default
+
+
+class BaseClient(_TransportConfig):
     """Base HTTP client used by all Hovercode sub-clients.
 
     This class owns the `requests.Session` and implements:
@@ -71,10 +246,12 @@ class BaseClient:
     Retry behavior:
         Retries are attempted for transient failures:
 
-        - HTTP 500/502/503/504 responses
+        - HTTP 429/500/502/503/504 responses
         - `requests` transport exceptions (connection errors, timeouts, etc.)
 
-        Backoff is exponential: `retry_backoff_seconds * (2 ** attempt)`.
+        Backoff is exponential: `retry_backoff_seconds * (2 ** attempt)`. When a
+        retryable response carries a `Retry-After` header (seconds or HTTP-date),
+        the delay is raised to that hint, capped at 60 seconds.
 
     Error mapping:
         Non-2xx responses are mapped to exception types:
@@ -89,6 +266,7 @@ class BaseClient:
     Response decoding:
         - For HTTP 204, returns `{}`.
         - Attempts to decode JSON; falls back to `response.text` if JSON decoding fails.
+        - Uses `orjson` for decoding when installed (`hovercode[orjson]`).
 
     Args:
         api_token: Hovercode API token. If not provided, `HOVERCODE_API_TOKEN`
@@ -102,6 +280,10 @@ class BaseClient:
             exponential backoff between retries. If not provided,
             `HOVERCODE_RETRY_BACKOFF_SECONDS` is used (or defaults to 0.5).
         session: Optional pre-configured `requests.Session` (useful for tests).
+            When omitted, a new session is created with a connection pool of
+            up to 32 keep-alive connections mounted for the API host.
+            A supplied session must be safe to use from several threads if the
+            concurrent batch helpers (e.g. `create_many()`) are used.
 
     Raises:
         AuthenticationError: If no API token is provided and the environment
@@ -109,9 +291,10 @@ class BaseClient:
         ValidationError: If `base_url` is empty.
     """
 
-    _API_TOKEN_ENV_VAR = "HOVERCODE_API_TOKEN"  # nosec B105
-    _ENV_PREFIX = "HOVERCODE"
-    _RETRYABLE_STATUS_CODES = frozenset({500, 502, 503, 504})
+    _POOL_MAXSIZE = 32
+    _JSON_HEADERS: Mapping[str, str] = MappingProxyType(
+        {"Content-Type": "application/json"}
+    )
 
     def __init__(
         self,
@@ -123,34 +306,31 @@ class BaseClient:
         retry_backoff_seconds: Optional[float] = None,
         session: Optional[requests.Session] = None,
     ) -> None:
-        if not base_url:
-            raise ValidationError("base_url must be a non-empty string.")
-
-        resolved_token = api_token or os.getenv(self._API_TOKEN_ENV_VAR)
-        if not resolved_token:
-            raise AuthenticationError(
-                f"Missing Hovercode API token. Provide api_token= or set "
-                f"{self._API_TOKEN_ENV_VAR}."
-            )
-
-        self._base_url = base_url.rstrip("/")
-        self._timeout_seconds = (
-            timeout_seconds
-            if timeout_seconds is not None
-            else self._get_env_float("TIMEOUT_SECONDS", default=10.0)
-        )
-        self._max_retries = (
-            max_retries
-            if max_retries is not None
-            else self._get_env_int("MAX_RETRIES", default=3)
-        )
-        self._retry_backoff_seconds = (
-            retry_backoff_seconds
-            if retry_backoff_seconds is not None
-            else self._get_env_float("RETRY_BACKOFF_SECONDS", default=0.5)
+        resolved_token = self._configure(
+            api_token=api_token,
+            base_url=base_url,
+            timeout_seconds=timeout_seconds,
+            max_retries=max_retries,
+            retry_backoff_seconds=retry_backoff_seconds,
         )
 
-        self._session = session or requests.Session()
+        if session is None:
+            # Deferred so that importing the package does not pay for `requests`.
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            parts = urlsplit(self._base_url)
+            if parts.scheme and parts.netloc:
+                session.mount(
+                    f"{parts.scheme}://{parts.netloc}",
+                    HTTPAdapter(
+                        pool_connections=1,
+                        pool_maxsize=self._POOL_MAXSIZE,
+                        pool_block=False,
+                    ),
+                )
+        self._session = session
         self._session.headers.update(
             {
                 "Accept": "application/json",
@@ -163,6 +343,21 @@ class BaseClient:
 
         self._session.close()
 
+    def __enter__(self) -> Self:
+        """Enter a context that closes the client on exit."""
+
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the client when leaving the context."""
+
+        self.close()
+
     def get(
         self,
         endpoint: str,
@@ -365,28 +560,29 @@ class BaseClient:
             NetworkError: For transport exceptions after exhausting retries.
         """
 
-        url = f"{self._base_url}/{endpoint.lstrip('/')}"
+        from requests.exceptions import RequestException
+
+        url = _join_url(self._base_url, endpoint)
         timeout = (
             timeout_seconds if timeout_seconds is not None else self._timeout_seconds
         )
+        # Loop-invariant request arguments are resolved once, not per attempt.
+        json_body = None if files is not None else json_data
+        headers = self._JSON_HEADERS if json_body is not None else None
 
         for attempt in range(self._max_retries + 1):
             try:
-                headers: Optional[dict[str, str]] = None
-                if files is None and json_data is not None:
-                    headers = {"Content-Type": "application/json"}
-
                 response = self._session.request(
                     method=method,
                     url=url,
                     params=params,
-                    json=None if files is not None else json_data,
+                    json=json_body,
                     data=data,
                     files=files,
                     timeout=timeout,
                     headers=headers,
                 )
-            except requests.exceptions.RequestException as exc:
+            except RequestException as exc:
                 if attempt < self._max_retries:
                     self._sleep_backoff(attempt)
                     continue
@@ -400,7 +596,9 @@ class BaseClient:
                 response.status_code in self._RETRYABLE_STATUS_CODES
                 and attempt < self._max_retries
             ):
-                self._sleep_backoff(attempt)
+                self._sleep_backoff(
+                    attempt, _parse_retry_after(response.headers.get("Retry-After"))
+                )
                 continue
 
             response_data = self._parse_response_data(response)
@@ -417,15 +615,17 @@ class BaseClient:
             response_data=None,  # pragma: no cover
         )  # pragma: no cover
 
-    def _sleep_backoff(self, attempt: int) -> None:
+    def _sleep_backoff(self, attempt: int, retry_after: Optional[float] = None) -> None:
         """Sleep according to exponential backoff schedule.
 
         Args:
             attempt: Attempt index (0-based) for computing backoff.
+            retry_after: Optional server-provided delay hint (seconds), e.g. from
+                a `Retry-After` header. The longer of the hint (capped at
+                `_MAX_RETRY_AFTER_SECONDS`) and the backoff delay is used.
         """
 
-        delay = self._retry_backoff_seconds * (2**attempt)
-        time.sleep(delay)
+        time.sleep(self._backoff_delay(attempt, retry_after))
 
     def _parse_response_data(self, response: requests.Response) -> JsonValue:
         """Parse response payload into JSON (preferred) or raw text.
@@ -441,77 +641,62 @@ class BaseClient:
             return {}
 
         try:
-            return cast(JsonValue, response.json())
+            return _decode_json(response.content, response.json)
         except ValueError:
             return response.text
 
-    def _map_http_error(
-        self, status_code: int, response_data: object, method: str, url: str
-    ) -> ApiError:
-        """Map an HTTP error response to an exception type."""
 
-        message = self._extract_error_message(status_code, response_data, method, url)
-        if status_code == 400:
-            return ValidationError(
-                message=message, status_code=status_code, response_data=response_data
-            )
-        if status_code == 401:
-            return AuthenticationError(
-                message=message, status_code=status_code, response_data=response_data
-            )
-        if status_code == 404:
-            return NotFoundError(
-                message=message, status_code=status_code, response_data=response_data
-            )
-        if status_code == 429:
-            return RateLimitError(
-                message=message, status_code=status_code, response_data=response_data
-            )
-        if 500 <= status_code <= 599:
-            return ServerError(
-                message=message, status_code=status_code, response_data=response_data
-            )
-        return ApiError(
-            message=message, status_code=status_code, response_data=response_data
-        )
-
-    def _extract_error_message(
-        self, status_code: int, response_data: object, method: str, url: str
-    ) -> str:
-        """Try to derive a useful error message from an error payload."""
+def _decode_json(content: bytes, fallback: Callable[[], JsonValue]) -> JsonValue:
+    """Decode a JSON body, preferring orjson when it gives the same result.
 
-        if isinstance(response_data, dict):
-            for key in ("detail", "error", "message"):
-                value = response_data.get(key)
-                if isinstance(value, str) and value.strip():
-                    return f"{method} {url} failed ({status_code}): {value}"
-            return f"{method} {url} failed ({status_code})."
+    orjson rejects input the stdlib accepts (a UTF-8 BOM, `NaN`) and turns
+    integers beyond 64 bits into floats. In those cases the transport's own
+    decoder (`fallback`) is used, so installing the extra never changes results.
 
-        if isinstance(response_data, str) and response_data.strip():
-            return f"{method} {url} failed ({status_code}): {response_data}"
+    Args:
+        content: Raw response body.
+        fallback: The transport's JSON decoder, e.g. `requests.Response.json`.
 
-        return f"{method} {url} failed ({status_code})."
+    Returns:
+        The decoded JSON value.
 
-    def _get_env_float(self, suffix: str, *, default: float) -> float:
-        """Read and parse a float from an env var, with safe fallback."""
+    Raises:
+        ValueError: If the body is not valid JSON for `fallback` either.
+    """
 
-        key = f"{self._ENV_PREFIX}_{suffix}"
-        raw = os.getenv(key)
-        if raw is None:
-            return default
+    if _fast_json_loads is not None and _LONG_DIGIT_RUN.search(content) is None:
         try:
-            return float(raw)
+            return _fast_json_loads(content)
         except ValueError:
-            return default
+            pass
+    return fallback()
 
-    def _get_env_int(self, suffix: str, *, default: int) -> int:
-        """Read and parse an int from an env var, with safe fallback."""
 
-        key = f"{self._ENV_PREFIX}_{suffix}"
-        raw = os.getenv(key)
-        if raw is None:
-            return default
-        try:
-            return int(raw)
-        except ValueError:
-            return default
+def _join_url(base_url: str, endpoint: str) -> str:
+    """Join a base URL and a relative endpoint."""
+
+    return f"{base_url}/{endpoint.lstrip('/')}"
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a `Retry-After` header value into a non-negative delay in seconds.
+
+    Args:
+        value: Raw header value: either delay-seconds or an HTTP-date.
+
+    Returns:
+        The delay in seconds, or None when the header is absent or malformed.
+    """
+
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isascii() and value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
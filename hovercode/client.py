@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from types import TracebackType
+from typing import TYPE_CHECKING, Optional
 
-from hovercode.hovercodes import HovercodesClient
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from hovercode.hovercodes import HovercodesClient
 
 
 class HovercodeClient:
@@ -16,13 +20,16 @@ class HovercodeClient:
         ```python
         from hovercode import HovercodeClient
 
-        client = HovercodeClient()
-        qr = client.hovercodes.create(
-            workspace="YOUR-WORKSPACE-ID",
-            qr_data="https://example.com",
-        )
+        with HovercodeClient() as client:
+            qr = client.hovercodes.create(
+                workspace="YOUR-WORKSPACE-ID",
+                qr_data="https://example.com",
+            )
         ```
 
+        Using the client as a context manager closes pooled connections on
+        exit; otherwise call `close()` when done.
+
     Args:
         api_token: Hovercode API token. If not provided, `HOVERCODE_API_TOKEN`
             is used.
@@ -68,6 +75,8 @@ class HovercodeClient:
         """Access the Hovercodes domain client (lazy-loaded)."""
 
         if self._hovercodes is None:
+            from hovercode.hovercodes import HovercodesClient
+
             self._hovercodes = HovercodesClient(
                 api_token=self._api_token,
                 base_url=self._base_url,
@@ -82,3 +91,18 @@ class HovercodeClient:
 
         if self._hovercodes is not None:
             self._hovercodes.close()
+
+    def __enter__(self) -> Self:
+        """Enter a context that closes the client on exit."""
+
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the client when leaving the context."""
+
+        self.close()
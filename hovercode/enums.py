@@ -2,10 +2,23 @@
 
 from __future__ import annotations
 
+import sys
 from enum import Enum
 
+if sys.version_info >= (3, 11):  # pragma: no cover - Python >= 3.11 only
+    from enum import StrEnum as _StrEnum
+else:  # pragma: no cover - Python < 3.11 only
 
-class QrType(str, Enum):
+    class _StrEnum(str, Enum):
+        """Backport of `enum.StrEnum`: members format and `str()` as their value."""
+
+        def __str__(self) -> str:
+            """Return the member value."""
+
+            return str.__str__(self)
+
+
+class QrType(_StrEnum):
     """QR code type.
 
     The API documentation currently lists:
@@ -17,7 +30,7 @@ class QrType(str, Enum):
     TEXT = "Text"
 
 
-class ErrorCorrection(str, Enum):
+class ErrorCorrection(_StrEnum):
     """QR code error correction level.
 
     The API documentation lists these options:
@@ -33,7 +46,7 @@ class ErrorCorrection(str, Enum):
     H = "H"
 
 
-class Pattern(str, Enum):
+class Pattern(_StrEnum):
     """QR code pattern style."""
 
     ORIGINAL = "Original"
@@ -43,7 +56,7 @@ class Pattern(str, Enum):
     TRIANGLES = "Triangles"
 
 
-class EyeStyle(str, Enum):
+class EyeStyle(_StrEnum):
     """QR code eye style."""
 
     SQUARE = "Square"
@@ -52,7 +65,7 @@ class EyeStyle(str, Enum):
     LEAF = "Leaf"
 
 
-class Frame(str, Enum):
+class Frame(_StrEnum):
     """QR code frame name."""
 
     BORDER = "border"
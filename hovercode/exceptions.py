@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Mapping, Optional
+
+if TYPE_CHECKING:
+    from hovercode.types import JsonObject
 
 
-@dataclass(frozen=True)
 class ApiError(Exception):
     """Base exception for Hovercode API errors.
 
@@ -16,15 +17,54 @@ class ApiError(Exception):
             response.
         response_data: Parsed response payload (JSON-decoded object or text),
             when available.
+
+    Args:
+        message: Human-readable error message.
+        status_code: HTTP status code, if any.
+        response_data: Parsed response payload, if any.
     """
 
-    message: str
-    status_code: Optional[int] = None
-    response_data: Optional[object] = None
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        response_data: Optional[object] = None,
+    ) -> None:
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+        self.response_data = response_data
+
+    def __repr__(self) -> str:
+        """Return a debug representation including the HTTP details."""
+
+        return (
+            f"{type(self).__name__}(message={self.message!r}, "
+            f"status_code={self.status_code!r}, "
+            f"response_data={self.response_data!r})"
+        )
+
+    def _fields(self) -> tuple[object, ...]:
+        """Return the fields that define equality, hashing, and pickling."""
+
+        return (self.message, self.status_code, self.response_data)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare by exact type and fields, like the former dataclass."""
+
+        if not isinstance(other, ApiError) or type(other) is not type(self):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    def __hash__(self) -> int:
+        """Hash the fields (raises `TypeError` for unhashable payloads)."""
+
+        return hash(self._fields())
+
+    def __reduce__(self) -> tuple[type[ApiError], tuple[object, ...]]:
+        """Pickle with all fields (only `message` is stored in `args`)."""
 
-    def __post_init__(self) -> None:
-        """Initialize the base Exception message."""
-        super().__init__(self.message)
+        return (type(self), self._fields())
 
 
 class AuthenticationError(ApiError):
@@ -53,3 +93,38 @@ class NetworkError(ApiError):
 
 class WebhookSignatureError(ValidationError):
     """Raised when a webhook signature fails verification."""
+
+
+class BatchError(ApiError):
+    """Raised when some requests made by a concurrent batch helper fail.
+
+    The results of the requests that succeeded are kept, so callers can retry
+    only the failures.
+
+    Attributes:
+        results: Mapping of batch key to the response of each request that
+            succeeded. Keys are payload indices for `create_many()` and QR code
+            IDs for `add_tags_batch()`.
+        errors: Mapping of batch key to the `ApiError` raised by each request
+            that failed, in input order.
+
+    Args:
+        message: Human-readable error message.
+        results: Responses of the successful requests, keyed by batch key.
+        errors: Errors of the failed requests, keyed by batch key.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        results: Mapping[Any, JsonObject],
+        errors: Mapping[Any, ApiError],
+    ) -> None:
+        super().__init__(message)
+        self.results = dict(results)
+        self.errors = dict(errors)
+
+    def _fields(self) -> tuple[object, ...]:
+        """Return the message, partial results, and per-item errors."""
+
+        return (self.message, self.results, self.errors)
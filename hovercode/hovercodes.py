@@ -2,15 +2,29 @@
 
 from __future__ import annotations
 
+import functools
 from enum import Enum
-from typing import Mapping, Optional, Sequence, Union
+from typing import TYPE_CHECKING, Callable, Mapping, Optional, Sequence, TypeVar, Union
 
-from hovercode.base_client import BaseClient, QueryParamValue
-from hovercode.enums import ErrorCorrection, EyeStyle, Frame, Pattern, QrType
-from hovercode.exceptions import ValidationError
-from hovercode.models import TagInput
+from hovercode.base_client import BaseClient
+from hovercode.exceptions import ApiError, BatchError, ValidationError
 from hovercode.types import JsonObject, JsonValue
 
+if TYPE_CHECKING:
+    from hovercode.base_client import QueryParamValue
+    from hovercode.enums import ErrorCorrection, EyeStyle, Frame, Pattern, QrType
+    from hovercode.models import TagInput
+
+# Upper bound on `page_size` for the activity endpoint, per the API docs.
+_MAX_ACTIVITY_PAGE_SIZE = 200
+
+# `create()` fields whose values may be given as (string-valued) enums.
+_ENUM_FIELDS = frozenset(
+    {"qr_type", "error_correction", "pattern", "eye_style", "frame"}
+)
+
+_K = TypeVar("_K")
+
 
 class HovercodesClient(BaseClient):
     """Client for creating and managing Hovercode QR codes.
@@ -136,53 +150,142 @@ class HovercodesClient(BaseClient):
             ```
         """
 
-        payload: JsonObject = {
+        payload: dict[str, Union[JsonValue, Enum]] = {
             "workspace": workspace,
             "qr_data": qr_data,
+            "qr_type": qr_type,
+            "dynamic": dynamic,
+            "display_name": display_name,
+            "domain": domain,
+            "generate_png": generate_png,
+            "gps_tracking": gps_tracking,
+            "error_correction": error_correction,
+            "size": size,
+            "logo_url": logo_url,
+            "logo_round": logo_round,
+            "primary_color": primary_color,
+            "background_color": background_color,
+            "pattern": pattern,
+            "eye_style": eye_style,
+            "frame": frame,
+            "has_border": has_border,
+            "text": text,
         }
-        if qr_type is not None:
-            payload["qr_type"] = _normalize_str_enum(qr_type)
-        if dynamic is not None:
-            payload["dynamic"] = dynamic
-        if display_name is not None:
-            payload["display_name"] = display_name
-        if domain is not None:
-            payload["domain"] = domain
-        if generate_png is not None:
-            payload["generate_png"] = generate_png
-        if gps_tracking is not None:
-            payload["gps_tracking"] = gps_tracking
-        if error_correction is not None:
-            payload["error_correction"] = _normalize_str_enum(error_correction)
-        if size is not None:
-            payload["size"] = size
-        if logo_url is not None:
-            payload["logo_url"] = logo_url
-        if logo_round is not None:
-            payload["logo_round"] = logo_round
-        if primary_color is not None:
-            payload["primary_color"] = primary_color
-        if background_color is not None:
-            payload["background_color"] = background_color
-        if pattern is not None:
-            payload["pattern"] = _normalize_str_enum(pattern)
-        if eye_style is not None:
-            payload["eye_style"] = _normalize_str_enum(eye_style)
-        if frame is not None:
-            payload["frame"] = _normalize_str_enum(frame)
-        if has_border is not None:
-            payload["has_border"] = has_border
-        if text is not None:
-            payload["text"] = text
-
-        result = self.post("hovercode/create/", json_data=payload)
-        if not isinstance(result, dict):
-            raise ValidationError(
-                message="Unexpected response type from create().",
-                status_code=None,
-                response_data=result,
+        return self.create_from_dict(payload)
+
+    def create_from_dict(
+        self, payload: Mapping[str, Union[JsonValue, Enum]]
+    ) -> JsonObject:
+        """Create a QR code from a pre-built request payload.
+
+        Endpoint: `POST /hovercode/create/`
+
+        This accepts the same fields as `create()` (which delegates here), keyed by
+        their API names. It is convenient when payloads are assembled from
+        configuration or generated in bulk. `None` values are omitted. Enum
+        members for `qr_type`, `error_correction`, `pattern`, `eye_style`, and
+        `frame` must have string values; other values are sent unchanged (enums
+        that are not `str`/`int` subclasses are sent as their `.value`). The
+        mapping is not modified.
+
+        Args:
+            payload: Request fields. `workspace` and `qr_data` are required by
+                the API.
+
+        Returns:
+            The created QR code object as returned by the API.
+
+        Raises:
+            hovercode.exceptions.ApiError: For non-2xx API responses.
+            ValidationError: If the API returns an unexpected response type.
+
+        Example:
+            ```python
+            from hovercode import HovercodeClient
+            from hovercode.enums import Frame
+
+            client = HovercodeClient()
+            qr = client.hovercodes.create_from_dict(
+                {
+                    "workspace": "YOUR-WORKSPACE-ID",
+                    "qr_data": "https://example.com",
+                    "frame": Frame.CIRCLE_VIEWFINDER,
+                }
+            )
+            print(qr["id"])
+            ```
+        """
+
+        body: JsonObject = {}
+        for key, value in payload.items():
+            if value is None:
+                continue
+            if not isinstance(value, Enum) or isinstance(value, (str, int, float)):
+                body[key] = value
+            elif key in _ENUM_FIELDS:
+                body[key] = _normalize_str_enum(value)
+            else:
+                body[key] = value.value
+
+        return _ensure_object(self.post("hovercode/create/", json_data=body), "create")
+
+    def create_many(
+        self,
+        payloads: Sequence[Mapping[str, Union[JsonValue, Enum]]],
+        *,
+        max_concurrency: int = 8,
+    ) -> list[JsonObject]:
+        """Create several QR codes, issuing requests concurrently.
+
+        The Hovercode API has no bulk create endpoint, so this sends one
+        `create_from_dict()` request per payload from a thread pool. Every
+        request runs, even when some fail.
+
+        Worker threads share this client's `requests.Session` and its pooled
+        keep-alive connections. `requests` does not promise that a `Session` is
+        thread-safe: the default session is only used to send these requests,
+        but a caller-supplied `session` must be safe to use from several threads
+        at once, and should pool at least `max_concurrency` connections.
+
+        Args:
+            payloads: Request payloads, in the format accepted by
+                `create_from_dict()`.
+            max_concurrency: Maximum number of requests in flight at once.
+                Values above the default pool size (32) are capped at 32.
+
+        Returns:
+            The created QR code objects, in the same order as `payloads`.
+
+        Raises:
+            ValidationError: If `max_concurrency` is less than 1.
+            hovercode.exceptions.BatchError: If any create request fails. Its
+                `results` maps payload index to each created QR code object, and
+                `errors` maps payload index to each request's `ApiError`.
+
+        Example:
+            ```python
+            from hovercode import HovercodeClient
+
+            client = HovercodeClient()
+            codes = client.hovercodes.create_many(
+                [
+                    {"workspace": "YOUR-WORKSPACE-ID", "qr_data": url}
+                    for url in ("https://example.com/a", "https://example.com/b")
+                ]
             )
-        return result
+            print([qr["id"] for qr in codes])
+            ```
+        """
+
+        _check_max_concurrency(max_concurrency)
+        if not payloads:
+            return []
+
+        calls = {
+            index: functools.partial(self.create_from_dict, payload)
+            for index, payload in enumerate(payloads)
+        }
+        return list(self._run_batch(calls, max_concurrency, "create").values())
 
     def list_for_workspace(
         self,
@@ -219,21 +322,16 @@ class HovercodesClient(BaseClient):
             ```
         """
 
-        params: dict[str, QueryParamValue] = {}
-        if q is not None:
-            params["q"] = q
-        if page is not None:
-            params["page"] = page
+        params: Optional[dict[str, QueryParamValue]] = None
+        if q is not None or page is not None:
+            params = {}
+            if q is not None:
+                params["q"] = q
+            if page is not None:
+                params["page"] = page
 
         endpoint = f"workspace/{workspace_id}/hovercodes/"
-        result = super().get(endpoint, params=params or None)
-        if not isinstance(result, dict):
-            raise ValidationError(
-                message="Unexpected response type from list_for_workspace().",
-                status_code=None,
-                response_data=result,
-            )
-        return result
+        return _ensure_object(self.get(endpoint, params=params), "list_for_workspace")
 
     def get_hovercode(self, qr_code_id: str) -> JsonObject:
         """Retrieve a previously created QR code.
@@ -252,14 +350,7 @@ class HovercodesClient(BaseClient):
             and `png` URLs once the files are available.
         """
 
-        result = super().get(f"hovercode/{qr_code_id}/")
-        if not isinstance(result, dict):
-            raise ValidationError(
-                message="Unexpected response type from get_hovercode().",
-                status_code=None,
-                response_data=result,
-            )
-        return result
+        return _ensure_object(self.get(f"hovercode/{qr_code_id}/"), "get_hovercode")
 
     def get_activity(
         self,
@@ -294,27 +385,25 @@ class HovercodesClient(BaseClient):
             ```
         """
 
-        if page_size is not None and page_size > 200:
+        if page_size is not None and page_size > _MAX_ACTIVITY_PAGE_SIZE:
             raise ValidationError(
-                message="page_size must be <= 200.",
+                message=f"page_size must be <= {_MAX_ACTIVITY_PAGE_SIZE}.",
                 status_code=None,
                 response_data={"page_size": page_size},
             )
 
-        params: dict[str, QueryParamValue] = {}
-        if page is not None:
-            params["page"] = page
-        if page_size is not None:
-            params["page_size"] = page_size
-
-        result = super().get(f"hovercode/{qr_code_id}/activity/", params=params or None)
-        if not isinstance(result, dict):
-            raise ValidationError(
-                message="Unexpected response type from get_activity().",
-                status_code=None,
-                response_data=result,
-            )
-        return result
+        params: Optional[dict[str, QueryParamValue]] = None
+        if page is not None or page_size is not None:
+            params = {}
+            if page is not None:
+                params["page"] = page
+            if page_size is not None:
+                params["page_size"] = page_size
+
+        return _ensure_object(
+            self.get(f"hovercode/{qr_code_id}/activity/", params=params),
+            "get_activity",
+        )
 
     def update(
         self,
@@ -350,22 +439,16 @@ class HovercodesClient(BaseClient):
                 response_data=None,
             )
 
-        payload: JsonObject = {}
-        if qr_data is not None:
-            payload["qr_data"] = qr_data
-        if display_name is not None:
-            payload["display_name"] = display_name
-        if gps_tracking is not None:
-            payload["gps_tracking"] = gps_tracking
+        fields: JsonObject = {
+            "qr_data": qr_data,
+            "display_name": display_name,
+            "gps_tracking": gps_tracking,
+        }
+        payload: JsonObject = {k: v for k, v in fields.items() if v is not None}
 
-        result = self.put(f"hovercode/{qr_code_id}/update/", json_data=payload)
-        if not isinstance(result, dict):
-            raise ValidationError(
-                message="Unexpected response type from update().",
-                status_code=None,
-                response_data=result,
-            )
-        return result
+        return _ensure_object(
+            self.put(f"hovercode/{qr_code_id}/update/", json_data=payload), "update"
+        )
 
     def add_tags(
         self,
@@ -416,21 +499,82 @@ class HovercodesClient(BaseClient):
                 response_data=None,
             )
 
-        tag_payload: list[JsonValue] = []
-        for tag in tags:
-            if isinstance(tag, TagInput):
-                tag_payload.append(tag.to_request_dict())
-            else:
-                tag_payload.append(dict(tag))
+        from hovercode.models import TagInput
 
-        result = self.post(f"hovercode/{qr_code_id}/tags/add/", json_data=tag_payload)
-        if not isinstance(result, dict):
+        tag_payload: list[JsonValue] = [
+            tag.to_request_dict() if isinstance(tag, TagInput) else dict(tag)
+            for tag in tags
+        ]
+
+        return _ensure_object(
+            self.post(f"hovercode/{qr_code_id}/tags/add/", json_data=tag_payload),
+            "add_tags",
+        )
+
+    def add_tags_batch(
+        self,
+        assignments: Mapping[str, Sequence[Union[TagInput, Mapping[str, JsonValue]]]],
+        *,
+        max_concurrency: int = 8,
+    ) -> dict[str, JsonObject]:
+        """Add tags to several QR codes, issuing requests concurrently.
+
+        Sends one `add_tags()` request per QR code from a thread pool. Every
+        request runs, even when some fail.
+
+        Worker threads share this client's `requests.Session`. `requests` does
+        not promise that a `Session` is thread-safe, so a caller-supplied
+        `session` must be safe to use from several threads at once (see
+        `create_many()`).
+
+        Args:
+            assignments: Mapping of QR code ID to the tags to add to it, in the
+                format accepted by `add_tags()`.
+            max_concurrency: Maximum number of requests in flight at once.
+                Values above the default pool size (32) are capped at 32.
+
+        Returns:
+            Mapping of QR code ID to the QR code object returned by the API, in
+            the same order as `assignments`.
+
+        Raises:
+            ValidationError: If `max_concurrency` is less than 1, or any QR code
+                is assigned an empty tags list (checked before any request).
+            hovercode.exceptions.BatchError: If any request fails. Its `results`
+                maps QR code ID to each tagged QR code object, and `errors` maps
+                QR code ID to each request's `ApiError`.
+
+        Example:
+            ```python
+            from hovercode import HovercodeClient
+            from hovercode.models import TagInput
+
+            client = HovercodeClient()
+            client.hovercodes.add_tags_batch(
+                {
+                    "QR-CODE-ID-1": [TagInput(title="marketing")],
+                    "QR-CODE-ID-2": [{"title": "campaign-2025"}],
+                }
+            )
+            ```
+        """
+
+        _check_max_concurrency(max_concurrency)
+        empty = [qr_code_id for qr_code_id, tags in assignments.items() if not tags]
+        if empty:
             raise ValidationError(
-                message="Unexpected response type from add_tags().",
+                message="add_tags_batch() requires a non-empty tags list per QR code.",
                 status_code=None,
-                response_data=result,
+                response_data={"qr_code_ids": empty},
             )
-        return result
+        if not assignments:
+            return {}
+
+        calls = {
+            qr_code_id: functools.partial(self.add_tags, qr_code_id, tags)
+            for qr_code_id, tags in assignments.items()
+        }
+        return self._run_batch(calls, max_concurrency, "add_tags")
 
     def delete_hovercode(self, qr_code_id: str) -> JsonObject:
         """Delete a QR code permanently.
@@ -452,14 +596,93 @@ class HovercodesClient(BaseClient):
             ```
         """
 
-        result = super().delete(f"hovercode/{qr_code_id}/delete/")
-        if not isinstance(result, dict):
-            raise ValidationError(
-                message="Unexpected response type from delete_hovercode().",
-                status_code=None,
-                response_data=result,
+        return _ensure_object(
+            self.delete(f"hovercode/{qr_code_id}/delete/"), "delete_hovercode"
+        )
+
+    def _run_batch(
+        self,
+        calls: Mapping[_K, Callable[[], JsonObject]],
+        max_concurrency: int,
+        operation: str,
+    ) -> dict[_K, JsonObject]:
+        """Run batch requests on a thread pool, collecting every outcome.
+
+        Args:
+            calls: Mapping of batch key to a zero-argument callable that sends
+                one request.
+            max_concurrency: Maximum number of requests in flight at once.
+            operation: Short operation name used in the error message.
+
+        Returns:
+            Mapping of batch key to response, in the same order as `calls`.
+
+        Raises:
+            hovercode.exceptions.BatchError: If any request raises `ApiError`.
+                It carries the successful responses and the per-key errors.
+        """
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        results: dict[_K, JsonObject] = {}
+        errors: dict[_K, ApiError] = {}
+        workers = min(max_concurrency, len(calls), self._POOL_MAXSIZE)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(call): key for key, call in calls.items()}
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except ApiError as exc:
+                    errors[futures[future]] = exc
+
+        if errors:
+            raise BatchError(
+                message=f"{len(errors)} of {len(calls)} {operation} requests failed.",
+                results={key: results[key] for key in calls if key in results},
+                errors={key: errors[key] for key in calls if key in errors},
             )
-        return result
+        return {key: results[key] for key in calls}
+
+
+def _check_max_concurrency(max_concurrency: int) -> None:
+    """Validate the worker count for the concurrent batch helpers.
+
+    Args:
+        max_concurrency: Requested maximum number of in-flight requests.
+
+    Raises:
+        ValidationError: If `max_concurrency` is less than 1.
+    """
+
+    if max_concurrency < 1:
+        raise ValidationError(
+            message="max_concurrency must be >= 1.",
+            status_code=None,
+            response_data={"max_concurrency": max_concurrency},
+        )
+
+
+def _ensure_object(result: JsonValue, method_name: str) -> JsonObject:
+    """Return `result` if it is a JSON object, else raise `ValidationError`.
+
+    Args:
+        result: Parsed response payload.
+        method_name: Name of the public method, used in the error message.
+
+    Returns:
+        The response payload as a JSON object.
+
+    Raises:
+        ValidationError: If the API returned a non-object payload.
+    """
+
+    if not isinstance(result, dict):
+        raise ValidationError(
+            message=f"Unexpected response type from {method_name}().",
+            status_code=None,
+            response_data=result,
+        )
+    return result
 
 
 def _normalize_str_enum(value: Union[str, Enum]) -> str:
@@ -473,12 +696,35 @@ def _normalize_str_enum(value: Union[str, Enum]) -> str:
     """
 
     if isinstance(value, Enum):
-        raw = value.value
-        if not isinstance(raw, str):
-            raise ValidationError(
-                message="Enum value must be a string.",
-                status_code=None,
-                response_data={"value": raw},
-            )
-        return raw
+        return _normalize_cached(value)
     return value
+
+
+@functools.lru_cache(maxsize=128, typed=True)
+def _normalize_cached(value: Enum) -> str:
+    """Return the string value of an Enum member, memoized per member.
+
+    Enum members are singletons with immutable values, so repeated arguments
+    (e.g. in batch creation loops) skip re-validation. Plain strings never reach
+    this cache; `_normalize_str_enum` returns them directly. `typed=True` keeps
+    members of different enum classes in separate slots even when they compare
+    equal (as `StrEnum` members with the same value do).
+
+    Args:
+        value: An Enum whose `.value` is a string.
+
+    Returns:
+        The member's string value.
+
+    Raises:
+        ValidationError: If the member's value is not a string.
+    """
+
+    raw = value.value
+    if not isinstance(raw, str):
+        raise ValidationError(
+            message="Enum value must be a string.",
+            status_code=None,
+            response_data={"value": raw},
+        )
+    return raw
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from itertools import repeat
 from typing import Mapping, Optional
 
 from hovercode.exceptions import ValidationError
@@ -121,18 +122,15 @@ class PaginatedResponse:
                 response_data=dict(data),
             )
 
-        parsed_results: JsonArray = []
-        for item in results:
-            if not isinstance(item, dict):
-                raise ValidationError(
-                    message="Expected each item in 'results' to be an object.",
-                    status_code=None,
-                    response_data=dict(data),
-                )
-            parsed_results.append(item)
+        if not all(map(isinstance, results, repeat(dict))):
+            raise ValidationError(
+                message="Expected each item in 'results' to be an object.",
+                status_code=None,
+                response_data=dict(data),
+            )
 
         return cls(
-            count=count, next=next_url, previous=previous_url, results=parsed_results
+            count=count, next=next_url, previous=previous_url, results=list(results)
         )
 
     def to_dict(self) -> JsonObject:
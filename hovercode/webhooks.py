@@ -7,11 +7,15 @@ containing an HMAC-SHA256 signature of the raw request body.
 
 from __future__ import annotations
 
-import hashlib
 import hmac
+import re
+from typing import BinaryIO
 
 from hovercode.exceptions import WebhookSignatureError
 
+# A hex-encoded HMAC-SHA256 digest: exactly 64 hex digits, in either case.
+_HEX_SHA256 = re.compile(r"[0-9a-fA-F]{64}")
+
 
 def compute_signature(secret: str, raw_payload: bytes) -> str:
     """Compute a Hovercode webhook signature.
@@ -24,7 +28,9 @@ def compute_signature(secret: str, raw_payload: bytes) -> str:
         Hex-encoded HMAC-SHA256 signature.
     """
 
-    return hmac.new(secret.encode("utf-8"), raw_payload, hashlib.sha256).hexdigest()
+    mac = hmac.new(secret.encode("utf-8"), digestmod="sha256")
+    mac.update(raw_payload)
+    return mac.hexdigest()
 
 
 def verify_signature(secret: str, raw_payload: bytes, received_signature: str) -> bool:
@@ -40,8 +46,39 @@ def verify_signature(secret: str, raw_payload: bytes, received_signature: str) -
         True if the signature matches; otherwise False.
     """
 
-    expected_signature = compute_signature(secret=secret, raw_payload=raw_payload)
-    return hmac.compare_digest(expected_signature, received_signature.strip())
+    mac = hmac.new(secret.encode("utf-8"), digestmod="sha256")
+    mac.update(raw_payload)
+    return _digest_matches(mac.digest(), received_signature)
+
+
+def verify_signature_stream(
+    secret: str,
+    stream: BinaryIO,
+    received_signature: str,
+    *,
+    chunk_size: int = 65536,
+) -> bool:
+    """Verify a Hovercode webhook signature over a binary stream.
+
+    The payload is hashed incrementally, so peak memory stays bounded by
+    `chunk_size` regardless of the payload size.
+
+    Args:
+        secret: Webhook secret configured in Hovercode.
+        stream: Binary file-like object positioned at the start of the raw
+            request body.
+        received_signature: Signature received in the request header. Leading and
+            trailing whitespace is ignored.
+        chunk_size: Number of bytes to read per chunk.
+
+    Returns:
+        True if the signature matches; otherwise False.
+    """
+
+    mac = hmac.new(secret.encode("utf-8"), digestmod="sha256")
+    for chunk in iter(lambda: stream.read(chunk_size), b""):
+        mac.update(chunk)
+    return _digest_matches(mac.digest(), received_signature)
 
 
 def verify_signature_or_raise(
@@ -62,3 +99,23 @@ def verify_signature_or_raise(
         secret=secret, raw_payload=raw_payload, received_signature=received_signature
     ):
         raise WebhookSignatureError(message="Invalid webhook signature.")
+
+
+def _digest_matches(expected: bytes, received_signature: str) -> bool:
+    """Compare a raw HMAC digest with a hex-encoded received signature.
+
+    Args:
+        expected: Raw digest computed locally.
+        received_signature: Hex signature from the request header. Leading and
+            trailing whitespace is ignored.
+
+    Returns:
+        True if the signature is exactly 64 hex digits decoding to `expected`;
+        otherwise False.
+    """
+
+    received = received_signature.strip()
+    # `bytes.fromhex` alone would also accept whitespace between hex digits.
+    if _HEX_SHA256.fullmatch(received) is None:
+        return False
+    return hmac.compare_digest(expected, bytes.fromhex(received))
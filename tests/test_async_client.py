@@ -0,0 +1,187 @@
+"""Tests for hovercode.async_client."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Callable
+
+import httpx
+import pytest
+
+import hovercode.base_client as base_client_module
+from hovercode.async_client import AsyncBaseClient
+from hovercode.exceptions import (
+    ApiError,
+    AuthenticationError,
+    NetworkError,
+    NotFoundError,
+    ValidationError,
+)
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+def _make_client(handler: Handler, **kwargs: Any) -> AsyncBaseClient:
+    """Create an AsyncBaseClient backed by a mock transport."""
+
+    params = {
+        "api_token": "test-token",
+        "timeout_seconds": 10.0,
+        "max_retries": 2,
+        "retry_backoff_seconds": 0.0,
+        "client": httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    }
+    params.update(kwargs)
+    return AsyncBaseClient(**params)
+
+
+def test_init_requires_token(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Missing token should raise AuthenticationError."""
+
+    monkeypatch.delenv("HOVERCODE_API_TOKEN", raising=False)
+    with pytest.raises(AuthenticationError):
+        AsyncBaseClient()
+
+
+def test_init_builds_default_http2_client() -> None:
+    """The default client should be an HTTP/2 AsyncClient with auth headers."""
+
+    client = AsyncBaseClient(api_token="t")
+    assert isinstance(client._client, httpx.AsyncClient)
+    assert client._client.headers["Authorization"] == "Token t"
+    assert client._base_url == "https://hovercode.com/api/v2"
+    asyncio.run(client.aclose())
+
+
+def test_verbs_send_expected_requests() -> None:
+    """Each verb should hit the joined URL with params and JSON bodies."""
+
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+    async def run() -> list[Any]:
+        async with _make_client(handler) as client:
+            return await asyncio.gather(
+                client.get("/hovercode/a/", params={"page": 2, "q": None}),
+                client.post("hovercode/create/", json_data={"a": 1}),
+                client.put("hovercode/a/update/", json_data={"b": 2}),
+                client.patch("hovercode/a/", json_data={"c": 3}),
+                client.delete("hovercode/a/delete/"),
+            )
+
+    assert asyncio.run(run()) == [{"ok": True}] * 5
+    assert [r.method for r in seen] == ["GET", "POST", "PUT", "PATCH", "DELETE"]
+    assert str(seen[0].url) == "https://hovercode.com/api/v2/hovercode/a/?page=2"
+    assert json.loads(seen[1].content) == {"a": 1}
+    assert seen[1].headers["Content-Type"] == "application/json"
+    assert seen[1].headers["Authorization"] == "Token test-token"
+
+
+def test_204_and_text_responses() -> None:
+    """204 should return {} and non-JSON bodies should return text."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "DELETE":
+            return httpx.Response(204)
+        return httpx.Response(200, text="not json")
+
+    async def run() -> tuple[Any, Any]:
+        client = _make_client(handler)
+        return await client.delete("x/"), await client.get("y/")
+
+    assert asyncio.run(run()) == ({}, "not json")
+
+
+def test_parses_json_without_fast_decoder(monkeypatch: pytest.MonkeyPatch) -> None:
+    """JSON decoding should fall back to httpx when orjson is unavailable."""
+
+    monkeypatch.setattr(base_client_module, "_fast_json_loads", None)
+    client = _make_client(lambda request: httpx.Response(200, json=[1]))
+    assert asyncio.run(client.get("x/")) == [1]
+
+
+@pytest.mark.parametrize(
+    ("body", "expected"),
+    [
+        (b'\xef\xbb\xbf{"a": 1}', {"a": 1}),
+        (
+            b'{"n": 123456789012345678901234567890}',
+            {"n": 123456789012345678901234567890},
+        ),
+    ],
+    ids=["bom", "big-int"],
+)
+def test_parses_json_orjson_rejects(body: bytes, expected: Any) -> None:
+    """Bodies orjson rejects or mis-decodes should match httpx's own decoding."""
+
+    assert base_client_module._fast_json_loads is not None
+    client = _make_client(lambda request: httpx.Response(200, content=body))
+    assert asyncio.run(client.get("x/")) == expected
+
+
+@pytest.mark.parametrize(
+    ("status", "exc_type"),
+    [(400, ValidationError), (404, NotFoundError), (418, ApiError)],
+)
+def test_error_mapping(status: int, exc_type: type[ApiError]) -> None:
+    """Non-2xx responses should map to the same exceptions as the sync client."""
+
+    client = _make_client(
+        lambda request: httpx.Response(status, json={"detail": "bad"})
+    )
+    with pytest.raises(exc_type) as exc:
+        asyncio.run(client.get("x/"))
+    assert exc.value.status_code == status
+    assert "bad" in str(exc.value)
+
+
+def test_retries_status_and_transport_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Retryable statuses and transport errors should be retried."""
+
+    delays: list[float] = []
+
+    async def _sleep(seconds: float) -> None:
+        delays.append(seconds)
+
+    monkeypatch.setattr("hovercode.async_client.asyncio.sleep", _sleep)
+    responses = iter(
+        [
+            httpx.Response(429, headers={"Retry-After": "2"}),
+            None,
+            httpx.Response(200, json={"ok": True}),
+        ]
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        response = next(responses)
+        if response is None:
+            raise httpx.ConnectError("boom", request=request)
+        return response
+
+    client = _make_client(handler, retry_backoff_seconds=0.5)
+    assert asyncio.run(client.get("x/")) == {"ok": True}
+    assert delays == [2.0, 1.0]
+
+
+def test_transport_error_exhausted() -> None:
+    """After retries are exhausted, raise NetworkError."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ReadTimeout("timeout", request=request)
+
+    client = _make_client(handler, max_retries=1)
+    with pytest.raises(NetworkError):
+        asyncio.run(client.get("x/"))
+
+
+def test_package_exports_async_client() -> None:
+    """The async client should be importable lazily from the package root."""
+
+    import hovercode
+
+    assert hovercode.AsyncBaseClient is AsyncBaseClient
+    assert base_client_module._TransportConfig in AsyncBaseClient.__mro__
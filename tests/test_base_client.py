@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import math
+from datetime import datetime, timedelta, timezone
 from typing import Any
 from urllib.parse import parse_qs, urlparse
 
@@ -22,6 +24,13 @@ from hovercode.exceptions import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make retry backoff sleeps free; tests that inspect delays re-patch it."""
+
+    monkeypatch.setattr(base_client_module.time, "sleep", lambda seconds: None)
+
+
 def _make_client(**kwargs: Any) -> BaseClient:
     """Create a BaseClient with sensible defaults for tests."""
 
@@ -69,32 +78,60 @@ def test_init_requires_base_url() -> None:
         BaseClient(api_token="t", base_url="")
 
 
-def test_env_parsing_valid_values(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Timeout and retry config should be read from env when not provided."""
+def test_init_uses_provided_session() -> None:
+    """A caller-supplied session should be used as-is (with auth headers)."""
 
-    monkeypatch.setenv("HOVERCODE_API_TOKEN", "env-token")
-    monkeypatch.setenv("HOVERCODE_TIMEOUT_SECONDS", "12.5")
-    monkeypatch.setenv("HOVERCODE_MAX_RETRIES", "4")
-    monkeypatch.setenv("HOVERCODE_RETRY_BACKOFF_SECONDS", "0.25")
+    session = requests.Session()
+    client = _make_client(session=session)
+    assert client._session is session
+    assert session.headers["Authorization"] == "Token test-token"
 
-    client = BaseClient(api_token=None, base_url="https://hovercode.com/api/v2")
-    assert client._timeout_seconds == 12.5
-    assert client._max_retries == 4
-    assert client._retry_backoff_seconds == 0.25
+
+def test_default_session_mounts_pooled_adapter_for_api_host() -> None:
+    """The default session should mount a pooled adapter for the API host."""
+
+    client = _make_client()
+    adapter = client._session.adapters["https://hovercode.com"]
+    assert isinstance(adapter, requests.adapters.HTTPAdapter)
+    assert adapter._pool_maxsize == BaseClient._POOL_MAXSIZE
+    assert adapter._pool_block is False
+
+
+def test_default_session_skips_mount_for_relative_base_url() -> None:
+    """A base_url without scheme/host should leave the default adapters alone."""
+
+    client = _make_client(base_url="api/v2")
+    assert set(client._session.adapters) == {"https://", "http://"}
 
 
-def test_env_parsing_invalid_values_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Invalid env values should fall back to defaults."""
+@pytest.mark.parametrize(
+    ("timeout", "retries", "backoff", "expected"),
+    [
+        ("12.5", "4", "0.25", (12.5, 4, 0.25)),
+        ("not-a-float", "not-an-int", "nope", (10.0, 3, 0.5)),
+    ],
+    ids=["valid", "invalid-falls-back"],
+)
+def test_env_parsing(
+    monkeypatch: pytest.MonkeyPatch,
+    timeout: str,
+    retries: str,
+    backoff: str,
+    expected: tuple[float, int, float],
+) -> None:
+    """Config should be read from env, falling back to defaults when invalid."""
 
     monkeypatch.setenv("HOVERCODE_API_TOKEN", "env-token")
-    monkeypatch.setenv("HOVERCODE_TIMEOUT_SECONDS", "not-a-float")
-    monkeypatch.setenv("HOVERCODE_MAX_RETRIES", "not-an-int")
-    monkeypatch.setenv("HOVERCODE_RETRY_BACKOFF_SECONDS", "nope")
+    monkeypatch.setenv("HOVERCODE_TIMEOUT_SECONDS", timeout)
+    monkeypatch.setenv("HOVERCODE_MAX_RETRIES", retries)
+    monkeypatch.setenv("HOVERCODE_RETRY_BACKOFF_SECONDS", backoff)
 
     client = BaseClient(api_token=None, base_url="https://hovercode.com/api/v2")
-    assert client._timeout_seconds == 10.0
-    assert client._max_retries == 3
-    assert client._retry_backoff_seconds == 0.5
+    assert (
+        client._timeout_seconds,
+        client._max_retries,
+        client._retry_backoff_seconds,
+    ) == expected
 
 
 @responses.activate
@@ -188,6 +225,53 @@ def test_invalid_json_falls_back_to_text() -> None:
     assert client.get("text/") == "not json"
 
 
+@responses.activate
+def test_parses_json_without_fast_decoder(monkeypatch: pytest.MonkeyPatch) -> None:
+    """JSON decoding should fall back to requests when orjson is unavailable."""
+
+    monkeypatch.setattr(base_client_module, "_fast_json_loads", None)
+    client = _make_client()
+    url = "https://hovercode.com/api/v2/plain/"
+    responses.add(responses.GET, url, json={"ok": True}, status=200)
+    responses.add(responses.GET, url, body="nope", status=200)
+    assert client.get("plain/") == {"ok": True}
+    assert client.get("plain/") == "nope"
+
+
+@pytest.mark.parametrize(
+    ("body", "expected"),
+    [
+        (b'\xef\xbb\xbf{"a": 1}', {"a": 1}),
+        (b"123456789012345678901234567890", 123456789012345678901234567890),
+    ],
+    ids=["bom", "big-int"],
+)
+@responses.activate
+def test_parses_json_orjson_rejects(body: bytes, expected: Any) -> None:
+    """Bodies orjson rejects or mis-decodes should match requests' decoding."""
+
+    assert base_client_module._fast_json_loads is not None
+    client = _make_client()
+    url = "https://hovercode.com/api/v2/odd/"
+    # No Content-Type, so requests sniffs the encoding (and honors the BOM).
+    responses.add(responses.GET, url, body=body, status=200, content_type=None)
+    out = client.get("odd/")
+    assert out == expected
+    assert type(out) is type(expected)
+
+
+@responses.activate
+def test_parses_json_nan_like_requests() -> None:
+    """`NaN` (rejected by orjson) should still decode to a float NaN."""
+
+    client = _make_client()
+    url = "https://hovercode.com/api/v2/nan/"
+    responses.add(responses.GET, url, body=b'{"a": NaN}', status=200)
+    out = client.get("nan/")
+    assert isinstance(out, dict)
+    assert math.isnan(out["a"])
+
+
 @responses.activate
 def test_error_message_from_text_payload() -> None:
     """Non-JSON error bodies should be included in the message."""
@@ -215,81 +299,55 @@ def test_error_message_from_dict_without_detail_keys() -> None:
 
 
 @responses.activate
-def test_error_mapping_400() -> None:
-    """400 should map to ValidationError."""
+def test_error_message_skips_blank_detail_keys() -> None:
+    """Whitespace-only values should fall through to the next message key."""
 
     client = _make_client()
-    url = "https://hovercode.com/api/v2/bad/"
-    responses.add(responses.GET, url, json={"detail": "bad"}, status=400)
+    url = "https://hovercode.com/api/v2/blank-error/"
+    responses.add(
+        responses.GET, url, json={"detail": "  ", "error": "real"}, status=400
+    )
+    responses.add(responses.GET, url, body=" \n", status=418)
     with pytest.raises(ValidationError) as exc:
-        client.get("bad/")
-    assert exc.value.status_code == 400
-    assert exc.value.response_data == {"detail": "bad"}
-    assert "bad" in str(exc.value)
-
-
-@responses.activate
-def test_error_mapping_401() -> None:
-    """401 should map to AuthenticationError."""
-
-    client = _make_client()
-    url = "https://hovercode.com/api/v2/auth/"
-    responses.add(responses.GET, url, json={"detail": "nope"}, status=401)
-    with pytest.raises(AuthenticationError):
-        client.get("auth/")
-
-
-@responses.activate
-def test_error_mapping_404() -> None:
-    """404 should map to NotFoundError."""
-
-    client = _make_client()
-    url = "https://hovercode.com/api/v2/missing/"
-    responses.add(responses.GET, url, json={"detail": "missing"}, status=404)
-    with pytest.raises(NotFoundError):
-        client.get("missing/")
-
-
-@responses.activate
-def test_error_mapping_429() -> None:
-    """429 should map to RateLimitError."""
-
-    client = _make_client()
-    url = "https://hovercode.com/api/v2/rate/"
-    responses.add(responses.GET, url, json={"detail": "slow"}, status=429)
-    with pytest.raises(RateLimitError):
-        client.get("rate/")
-
-
-@responses.activate
-def test_error_mapping_5xx() -> None:
-    """5xx should map to ServerError."""
-
-    client = _make_client()
-    url = "https://hovercode.com/api/v2/server/"
-    responses.add(responses.GET, url, json={"detail": "oops"}, status=500)
-    with pytest.raises(ServerError):
-        client.get("server/")
-
-
+        client.get("blank-error/")
+    assert str(exc.value).endswith("(400): real")
+    with pytest.raises(ApiError) as exc2:
+        client.get("blank-error/")
+    assert str(exc2.value).endswith("(418).")
+
+
+@pytest.mark.parametrize(
+    ("status", "payload", "exc_type"),
+    [
+        (400, {"detail": "bad"}, ValidationError),
+        (401, {"detail": "nope"}, AuthenticationError),
+        (404, {"detail": "missing"}, NotFoundError),
+        (429, {"detail": "slow"}, RateLimitError),
+        (500, {"detail": "oops"}, ServerError),
+        (418, ["weird"], ApiError),
+    ],
+)
 @responses.activate
-def test_error_mapping_other_status() -> None:
-    """Other non-2xx codes should map to ApiError."""
+def test_error_mapping(status: int, payload: Any, exc_type: type[ApiError]) -> None:
+    """Non-2xx statuses should map to the matching ApiError subclass."""
 
     client = _make_client()
-    url = "https://hovercode.com/api/v2/teapot/"
-    responses.add(responses.GET, url, json=["weird"], status=418)
-    with pytest.raises(ApiError) as exc:
-        client.get("teapot/")
-    assert exc.value.status_code == 418
+    url = "https://hovercode.com/api/v2/err/"
+    responses.add(responses.GET, url, json=payload, status=status)
+    with pytest.raises(exc_type) as exc:
+        client.get("err/")
+    assert type(exc.value) is exc_type
+    assert exc.value.status_code == status
+    assert exc.value.response_data == payload
+    if isinstance(payload, dict):
+        assert payload["detail"] in str(exc.value)
 
 
 @responses.activate
-def test_retries_on_retryable_status(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_retries_on_retryable_status() -> None:
     """Retryable 5xx responses should be retried."""
 
     client = _make_client(max_retries=2)
-    monkeypatch.setattr(client, "_sleep_backoff", lambda attempt: None)
 
     url = "https://hovercode.com/api/v2/unstable/"
     responses.add(responses.GET, url, json={"detail": "no"}, status=500)
@@ -301,11 +359,10 @@ def test_retries_on_retryable_status(monkeypatch: pytest.MonkeyPatch) -> None:
 
 
 @responses.activate
-def test_retries_on_request_exception(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_retries_on_request_exception() -> None:
     """Transport exceptions should be retried up to max_retries."""
 
     client = _make_client(max_retries=2)
-    monkeypatch.setattr(client, "_sleep_backoff", lambda attempt: None)
 
     url = "https://hovercode.com/api/v2/flaky/"
     responses.add(responses.GET, url, body=requests.exceptions.ConnectionError("boom"))
@@ -317,11 +374,10 @@ def test_retries_on_request_exception(monkeypatch: pytest.MonkeyPatch) -> None:
 
 
 @responses.activate
-def test_request_exception_exhausted(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_request_exception_exhausted() -> None:
     """After retries are exhausted, raise NetworkError."""
 
     client = _make_client(max_retries=1)
-    monkeypatch.setattr(client, "_sleep_backoff", lambda attempt: None)
 
     url = "https://hovercode.com/api/v2/down/"
     responses.add(responses.GET, url, body=requests.exceptions.Timeout("timeout"))
@@ -331,6 +387,66 @@ def test_request_exception_exhausted(monkeypatch: pytest.MonkeyPatch) -> None:
         client.get("down/")
 
 
+@responses.activate
+def test_retries_429_with_retry_after_hint(monkeypatch: pytest.MonkeyPatch) -> None:
+    """429 responses should be retried, passing the Retry-After hint along."""
+
+    client = _make_client(max_retries=1)
+    hints: list[Any] = []
+    monkeypatch.setattr(
+        client,
+        "_sleep_backoff",
+        lambda attempt, retry_after=None: hints.append(retry_after),
+    )
+
+    url = "https://hovercode.com/api/v2/limited/"
+    responses.add(responses.GET, url, json={}, status=429, headers={"Retry-After": "3"})
+    responses.add(responses.GET, url, json={"ok": True}, status=200)
+
+    assert client.get("limited/") == {"ok": True}
+    assert hints == [3.0]
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, None),
+        (" 5 ", 5.0),
+        ("soon", None),
+        ("\u00b2", None),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+        ("Wed, 21 Oct 2015 07:28:00 -0000", 0.0),
+    ],
+)
+def test_parse_retry_after(value: Any, expected: Any) -> None:
+    """Retry-After should accept delay-seconds and (past) HTTP-dates."""
+
+    assert base_client_module._parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_future_http_date() -> None:
+    """A future HTTP-date should yield a positive delay."""
+
+    from email.utils import format_datetime
+
+    future = datetime.now(timezone.utc) + timedelta(seconds=120)
+    delay = base_client_module._parse_retry_after(format_datetime(future, usegmt=True))
+    assert delay is not None and 100 < delay <= 120
+
+
+def test_sleep_backoff_uses_capped_retry_after(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Retry-After should extend the delay, but never beyond the cap."""
+
+    client = _make_client(retry_backoff_seconds=0.5)
+    delays: list[float] = []
+    monkeypatch.setattr(base_client_module.time, "sleep", delays.append)
+
+    client._sleep_backoff(0, retry_after=0.1)
+    client._sleep_backoff(0, retry_after=2.0)
+    client._sleep_backoff(0, retry_after=10_000.0)
+    assert delays == [0.5, 2.0, BaseClient._MAX_RETRY_AFTER_SECONDS]
+
+
 def test_sleep_backoff_exponential(monkeypatch: pytest.MonkeyPatch) -> None:
     """Backoff should grow exponentially with attempt index."""
 
@@ -368,3 +484,16 @@ def test_close_calls_session_close(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(client._session, "close", _close)
     client.close()
     assert called["closed"] is True
+
+
+def test_context_manager_closes_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Leaving a `with` block should close the underlying session."""
+
+    called = {"closed": False}
+
+    def _close() -> None:
+        called["closed"] = True
+
+    with _make_client() as client:
+        monkeypatch.setattr(client._session, "close", _close)
+    assert called["closed"] is True
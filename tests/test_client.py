@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import subprocess  # nosec B404
 import sys
 import types
 
@@ -32,6 +33,21 @@ def test_facade_lazy_loads_and_caches_subclient() -> None:
     assert hc1._retry_backoff_seconds == 0.1
 
 
+def test_construction_does_not_import_resource_layer() -> None:
+    """Building the facade should defer the HTTP/resource modules until used."""
+
+    code = (
+        "import sys\n"
+        "from hovercode import HovercodeClient\n"
+        "client = HovercodeClient(api_token='t')\n"
+        "assert 'hovercode.hovercodes' not in sys.modules\n"
+        "assert 'requests' not in sys.modules\n"
+        "client.hovercodes\n"
+        "assert 'hovercode.hovercodes' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # nosec B603
+
+
 def test_close_noop_when_not_initialized() -> None:
     """close() should not error if no sub-clients were created."""
 
@@ -55,16 +71,31 @@ def test_close_closes_initialized_clients(monkeypatch: pytest.MonkeyPatch) -> No
     assert called["closed"] is True
 
 
+def test_context_manager_closes_on_exit(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Leaving a `with` block should close the client."""
+
+    called = {"closed": False}
+
+    def _close() -> None:
+        called["closed"] = True
+
+    with HovercodeClient(api_token="t") as client:
+        monkeypatch.setattr(client, "close", _close)
+        assert client.hovercodes is not None
+    assert called["closed"] is True
+
+
 def test_load_dotenv_calls_loader(monkeypatch: pytest.MonkeyPatch) -> None:
     """When load_dotenv=True, the dotenv loader should be called."""
 
     called = {"loaded": False}
-    module = types.ModuleType("dotenv")
 
     def _load_dotenv() -> None:
         called["loaded"] = True
 
-    module.load_dotenv = _load_dotenv  # type: ignore[attr-defined]
+    # `from dotenv import load_dotenv` only needs an attribute on whatever object
+    # sits in sys.modules, so a namespace stands in for a real module.
+    module = types.SimpleNamespace(load_dotenv=_load_dotenv)
     monkeypatch.setitem(sys.modules, "dotenv", module)
 
     HovercodeClient(load_dotenv=True)
@@ -0,0 +1,16 @@
+"""Tests for hovercode.enums."""
+
+from __future__ import annotations
+
+import json
+
+from hovercode.enums import ErrorCorrection, EyeStyle, Frame, Pattern, QrType
+
+
+def test_enum_members_are_plain_strings() -> None:
+    """Members should compare, format, and serialize as their string values."""
+
+    assert QrType.LINK == "Link"
+    assert str(Frame.CIRCLE_VIEWFINDER) == "circle-viewfinder"
+    assert f"{Pattern.DIAMONDS}" == "Diamonds"
+    assert json.dumps([ErrorCorrection.Q, EyeStyle.ROUNDED]) == '["Q", "Rounded"]'
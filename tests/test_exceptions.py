@@ -0,0 +1,57 @@
+"""Tests for hovercode.exceptions."""
+
+from __future__ import annotations
+
+import pickle  # nosec B403
+
+from hovercode.exceptions import ApiError, BatchError, NotFoundError
+
+
+def test_api_error_fields_and_message() -> None:
+    """ApiError should expose its fields and use the message as str()."""
+
+    exc = NotFoundError("missing", status_code=404, response_data={"detail": "x"})
+    assert str(exc) == "missing"
+    assert exc.message == "missing"
+    assert exc.status_code == 404
+    assert exc.response_data == {"detail": "x"}
+    assert repr(exc) == (
+        "NotFoundError(message='missing', status_code=404, "
+        "response_data={'detail': 'x'})"
+    )
+
+
+def test_api_error_round_trips_through_pickle() -> None:
+    """Pickling should preserve the exception type and all fields."""
+
+    exc = pickle.loads(pickle.dumps(ApiError("boom", 500, "oops")))  # nosec B301
+    assert type(exc) is ApiError
+    assert (exc.message, exc.status_code, exc.response_data) == ("boom", 500, "oops")
+
+
+def test_api_error_compares_by_type_and_fields() -> None:
+    """Equality and hashing should follow the exception type and its fields."""
+
+    exc = NotFoundError("missing", status_code=404)
+    assert exc == NotFoundError("missing", status_code=404)
+    assert hash(exc) == hash(NotFoundError("missing", status_code=404))
+    assert exc != NotFoundError("missing", status_code=410)
+    assert exc != ApiError("missing", status_code=404)
+    assert exc != "missing"
+
+
+def test_batch_error_keeps_partial_results_through_pickle() -> None:
+    """BatchError should expose and pickle its partial results and errors."""
+
+    exc = BatchError(
+        "1 of 2 create requests failed.", {0: {"id": "a"}}, {1: ApiError("x")}
+    )
+    assert isinstance(exc, ApiError)
+    assert exc.status_code is None
+    copy = pickle.loads(pickle.dumps(exc))  # nosec B301
+    assert type(copy) is BatchError
+    assert copy.message == exc.message
+    assert copy.results == {0: {"id": "a"}}
+    assert list(copy.errors) == [1]
+    assert copy.errors == {1: ApiError("x")}
+    assert copy == exc
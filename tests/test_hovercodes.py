@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import json
-from enum import Enum
+import subprocess  # nosec B404
+import sys
+from enum import Enum, IntEnum
 from typing import Any
 from urllib.parse import parse_qs, urlparse
 
@@ -11,10 +13,17 @@ import pytest
 import responses
 
 from hovercode.enums import ErrorCorrection, EyeStyle, Frame, Pattern, QrType
-from hovercode.exceptions import ValidationError
-from hovercode.hovercodes import HovercodesClient, _normalize_str_enum
+from hovercode.exceptions import BatchError, NotFoundError, ValidationError
+from hovercode.hovercodes import (
+    HovercodesClient,
+    _normalize_cached,
+    _normalize_str_enum,
+)
 from hovercode.models import TagInput
 
+# Empty paginated envelope reused by list-style endpoint tests.
+_EMPTY_PAGE = {"count": 0, "next": None, "previous": None, "results": []}
+
 
 def _json_body(request_body: Any) -> object:
     """Decode a JSON request body from responses call."""
@@ -113,15 +122,134 @@ def test_create_includes_all_optional_fields_and_accepts_str_values() -> None:
 
 
 @responses.activate
-def test_create_raises_on_non_object_response() -> None:
-    """create() should raise if the API returns a non-object response."""
+def test_create_from_dict_normalizes_enums_and_drops_none() -> None:
+    """create_from_dict() should post a normalized copy of the payload."""
+
+    client = HovercodesClient(api_token="t")
+    url = "https://hovercode.com/api/v2/hovercode/create/"
+    responses.add(responses.POST, url, json={"id": "3"}, status=200)
+
+    payload = {
+        "workspace": "w",
+        "qr_data": "https://example.com",
+        "frame": Frame.CIRCLE_VIEWFINDER,
+        "pattern": "Circles",
+        "display_name": None,
+    }
+    out = client.create_from_dict(payload)
+    assert out["id"] == "3"
+
+    body = _json_body(responses.calls[0].request.body)
+    assert body == {
+        "workspace": "w",
+        "qr_data": "https://example.com",
+        "frame": "circle-viewfinder",
+        "pattern": "Circles",
+    }
+    assert payload["frame"] is Frame.CIRCLE_VIEWFINDER
+
+
+@responses.activate
+def test_create_from_dict_passes_other_enums_through() -> None:
+    """Enums outside the style fields should be posted as their values."""
+
+    class Size(IntEnum):
+        """Int-valued enum for testing."""
+
+        LARGE = 400
+
+    class Color(Enum):
+        """Plain enum for testing."""
+
+        RED = "#ff0000"
+
+    client = HovercodesClient(api_token="t")
+    url = "https://hovercode.com/api/v2/hovercode/create/"
+    responses.add(responses.POST, url, json={"id": "4"}, status=200)
+
+    client.create_from_dict(
+        {
+            "workspace": "w",
+            "qr_data": "x",
+            "size": Size.LARGE,
+            "primary_color": Color.RED,
+        }
+    )
+    body = _json_body(responses.calls[0].request.body)
+    assert body == {
+        "workspace": "w",
+        "qr_data": "x",
+        "size": 400,
+        "primary_color": "#ff0000",
+    }
+
+
+def test_create_from_dict_rejects_non_str_style_enum() -> None:
+    """Style fields should still require string-valued enums."""
+
+    class Bad(Enum):
+        """Int-valued plain enum for testing."""
+
+        X = 1
+
+    client = HovercodesClient(api_token="t")
+    with pytest.raises(ValidationError):
+        client.create_from_dict({"workspace": "w", "qr_data": "x", "frame": Bad.X})
+
+
+@responses.activate
+def test_create_many_preserves_order() -> None:
+    """create_many() should return one result per payload, in input order."""
 
     client = HovercodesClient(api_token="t")
     url = "https://hovercode.com/api/v2/hovercode/create/"
-    responses.add(responses.POST, url, json=["no"], status=200)
 
+    def _echo(request: Any) -> tuple[int, dict[str, str], str]:
+        body = _json_body(request.body)
+        assert isinstance(body, dict)
+        return 200, {}, json.dumps({"id": body["qr_data"]})
+
+    responses.add_callback(responses.POST, url, callback=_echo)
+
+    payloads = [{"workspace": "w", "qr_data": str(i)} for i in range(5)]
+    out = client.create_many(payloads, max_concurrency=3)
+    assert [qr["id"] for qr in out] == ["0", "1", "2", "3", "4"]
+    assert len(responses.calls) == 5
+    assert client.create_many([]) == []
+
+
+@responses.activate
+def test_create_many_reports_partial_failures() -> None:
+    """create_many() should run every request and keep successful results."""
+
+    client = HovercodesClient(api_token="t")
+    url = "https://hovercode.com/api/v2/hovercode/create/"
+
+    def _fail_odd(request: Any) -> tuple[int, dict[str, str], str]:
+        body = _json_body(request.body)
+        assert isinstance(body, dict)
+        if int(str(body["qr_data"])) % 2:
+            return 404, {}, json.dumps({"detail": "missing"})
+        return 200, {}, json.dumps({"id": body["qr_data"]})
+
+    responses.add_callback(responses.POST, url, callback=_fail_odd)
+
+    payloads = [{"workspace": "w", "qr_data": str(i)} for i in range(4)]
+    with pytest.raises(BatchError) as exc:
+        client.create_many(payloads, max_concurrency=2)
+    assert str(exc.value) == "2 of 4 create requests failed."
+    assert exc.value.results == {0: {"id": "0"}, 2: {"id": "2"}}
+    assert list(exc.value.errors) == [1, 3]
+    assert all(isinstance(e, NotFoundError) for e in exc.value.errors.values())
+    assert len(responses.calls) == 4
+
+
+def test_create_many_rejects_non_positive_concurrency() -> None:
+    """create_many() should validate max_concurrency."""
+
+    client = HovercodesClient(api_token="t")
     with pytest.raises(ValidationError):
-        client.create(workspace="w", qr_data="x")
+        client.create_many([{"workspace": "w", "qr_data": "x"}], max_concurrency=0)
 
 
 @responses.activate
@@ -130,12 +258,7 @@ def test_list_for_workspace_encodes_query_params() -> None:
 
     client = HovercodesClient(api_token="t")
     url = "https://hovercode.com/api/v2/workspace/ws/hovercodes/"
-    responses.add(
-        responses.GET,
-        url,
-        json={"count": 0, "next": None, "previous": None, "results": []},
-        status=200,
-    )
+    responses.add(responses.GET, url, json=_EMPTY_PAGE, status=200)
 
     out = client.list_for_workspace("ws", q="twitter", page=2)
     assert out["count"] == 0
@@ -152,27 +275,28 @@ def test_list_for_workspace_without_query_params() -> None:
 
     client = HovercodesClient(api_token="t")
     url = "https://hovercode.com/api/v2/workspace/ws/hovercodes/"
-    responses.add(
-        responses.GET,
-        url,
-        json={"count": 0, "next": None, "previous": None, "results": []},
-        status=200,
-    )
+    responses.add(responses.GET, url, json=_EMPTY_PAGE, status=200)
 
     client.list_for_workspace("ws")
     assert responses.calls[0].request.url == url
 
 
+@pytest.mark.parametrize(
+    ("kwargs", "expected"),
+    [({"q": "x"}, {"q": ["x"]}), ({"page": 3}, {"page": ["3"]})],
+)
 @responses.activate
-def test_list_for_workspace_raises_on_non_object_response() -> None:
-    """list_for_workspace() should raise on unexpected response types."""
+def test_list_for_workspace_sends_only_provided_params(
+    kwargs: dict[str, Any], expected: dict[str, list[str]]
+) -> None:
+    """list_for_workspace() should send exactly the query params provided."""
 
     client = HovercodesClient(api_token="t")
     url = "https://hovercode.com/api/v2/workspace/ws/hovercodes/"
-    responses.add(responses.GET, url, json=["no"], status=200)
+    responses.add(responses.GET, url, json={"count": 0}, status=200)
 
-    with pytest.raises(ValidationError):
-        client.list_for_workspace("ws")
+    client.list_for_workspace("ws", **kwargs)
+    assert parse_qs(urlparse(responses.calls[0].request.url).query) == expected
 
 
 @responses.activate
@@ -187,18 +311,6 @@ def test_get_uses_correct_path() -> None:
     assert out["id"] == "abc"
 
 
-@responses.activate
-def test_get_raises_on_non_object_response() -> None:
-    """get() should raise on unexpected response types."""
-
-    client = HovercodesClient(api_token="t")
-    url = "https://hovercode.com/api/v2/hovercode/abc/"
-    responses.add(responses.GET, url, json=["no"], status=200)
-
-    with pytest.raises(ValidationError):
-        client.get_hovercode("abc")
-
-
 def test_get_activity_page_size_validation() -> None:
     """page_size must be <= 200."""
 
@@ -213,12 +325,7 @@ def test_get_activity_success_with_params() -> None:
 
     client = HovercodesClient(api_token="t")
     url = "https://hovercode.com/api/v2/hovercode/abc/activity/"
-    responses.add(
-        responses.GET,
-        url,
-        json={"count": 0, "next": None, "previous": None, "results": []},
-        status=200,
-    )
+    responses.add(responses.GET, url, json=_EMPTY_PAGE, status=200)
 
     client.get_activity("abc", page=2, page_size=50)
     parsed = urlparse(responses.calls[0].request.url)
@@ -233,27 +340,28 @@ def test_get_activity_success_without_params() -> None:
 
     client = HovercodesClient(api_token="t")
     url = "https://hovercode.com/api/v2/hovercode/abc/activity/"
-    responses.add(
-        responses.GET,
-        url,
-        json={"count": 0, "next": None, "previous": None, "results": []},
-        status=200,
-    )
+    responses.add(responses.GET, url, json=_EMPTY_PAGE, status=200)
 
     client.get_activity("abc")
     assert responses.calls[0].request.url == url
 
 
+@pytest.mark.parametrize(
+    ("kwargs", "expected"),
+    [({"page": 2}, {"page": ["2"]}), ({"page_size": 10}, {"page_size": ["10"]})],
+)
 @responses.activate
-def test_get_activity_raises_on_non_object_response() -> None:
-    """get_activity() should raise on unexpected response types."""
+def test_get_activity_sends_only_provided_params(
+    kwargs: dict[str, Any], expected: dict[str, list[str]]
+) -> None:
+    """get_activity() should send exactly the query params provided."""
 
     client = HovercodesClient(api_token="t")
     url = "https://hovercode.com/api/v2/hovercode/abc/activity/"
-    responses.add(responses.GET, url, json=["no"], status=200)
+    responses.add(responses.GET, url, json={"count": 0}, status=200)
 
-    with pytest.raises(ValidationError):
-        client.get_activity("abc")
+    client.get_activity("abc", **kwargs)
+    assert parse_qs(urlparse(responses.calls[0].request.url).query) == expected
 
 
 def test_update_requires_at_least_one_field() -> None:
@@ -292,18 +400,6 @@ def test_update_sends_qr_data_and_gps_tracking() -> None:
     assert body == {"qr_data": "https://x", "gps_tracking": True}
 
 
-@responses.activate
-def test_update_raises_on_non_object_response() -> None:
-    """update() should raise on unexpected response types."""
-
-    client = HovercodesClient(api_token="t")
-    url = "https://hovercode.com/api/v2/hovercode/abc/update/"
-    responses.add(responses.PUT, url, json=["no"], status=200)
-
-    with pytest.raises(ValidationError):
-        client.update("abc", display_name="x")
-
-
 def test_add_tags_requires_non_empty_list() -> None:
     """add_tags() requires at least one tag."""
 
@@ -328,15 +424,61 @@ def test_add_tags_accepts_taginput_and_mapping() -> None:
 
 
 @responses.activate
-def test_add_tags_raises_on_non_object_response() -> None:
-    """add_tags() should raise on unexpected response types."""
+def test_add_tags_batch_maps_results_by_qr_code_id() -> None:
+    """add_tags_batch() should tag each QR code and key results by its ID."""
 
     client = HovercodesClient(api_token="t")
-    url = "https://hovercode.com/api/v2/hovercode/abc/tags/add/"
-    responses.add(responses.POST, url, json=["no"], status=200)
+    for qr_code_id in ("a", "b", "c"):
+        responses.add(
+            responses.POST,
+            f"https://hovercode.com/api/v2/hovercode/{qr_code_id}/tags/add/",
+            json={"id": qr_code_id},
+            status=200,
+        )
+
+    out = client.add_tags_batch(
+        {
+            "a": [TagInput(title="t1")],
+            "b": [{"title": "t2"}],
+            "c": [TagInput(id="9")],
+        },
+        max_concurrency=2,
+    )
+    assert list(out) == ["a", "b", "c"]
+    assert {k: v["id"] for k, v in out.items()} == {"a": "a", "b": "b", "c": "c"}
+    assert len(responses.calls) == 3
+    assert client.add_tags_batch({}) == {}
+
+
+@responses.activate
+def test_add_tags_batch_reports_partial_failures() -> None:
+    """add_tags_batch() should keep the results of the requests that succeeded."""
+
+    client = HovercodesClient(api_token="t")
+    base = "https://hovercode.com/api/v2/hovercode"
+    responses.add(responses.POST, f"{base}/a/tags/add/", json={"id": "a"})
+    responses.add(responses.POST, f"{base}/b/tags/add/", status=404, json={})
+    responses.add(responses.POST, f"{base}/c/tags/add/", json={"id": "c"})
+
+    with pytest.raises(BatchError) as exc:
+        client.add_tags_batch(
+            {qr_code_id: [TagInput(title="t")] for qr_code_id in ("a", "b", "c")},
+        )
+    assert str(exc.value) == "1 of 3 add_tags requests failed."
+    assert exc.value.results == {"a": {"id": "a"}, "c": {"id": "c"}}
+    assert list(exc.value.errors) == ["b"]
+
+
+def test_add_tags_batch_validates_before_sending() -> None:
+    """add_tags_batch() should reject empty tag lists and bad concurrency."""
+
+    client = HovercodesClient(api_token="t")
+    with pytest.raises(ValidationError) as exc:
+        client.add_tags_batch({"a": [TagInput(title="t")], "b": []})
+    assert exc.value.response_data == {"qr_code_ids": ["b"]}
 
     with pytest.raises(ValidationError):
-        client.add_tags("abc", [TagInput(title="t")])
+        client.add_tags_batch({"a": [TagInput(title="t")]}, max_concurrency=0)
 
 
 @responses.activate
@@ -351,16 +493,49 @@ def test_delete_returns_empty_dict_for_204() -> None:
     assert out == {}
 
 
+@pytest.mark.parametrize(
+    ("verb", "path", "method", "args", "kwargs"),
+    [
+        (
+            responses.POST,
+            "hovercode/create/",
+            "create",
+            (),
+            {"workspace": "w", "qr_data": "x"},
+        ),
+        (responses.GET, "workspace/ws/hovercodes/", "list_for_workspace", ("ws",), {}),
+        (responses.GET, "hovercode/abc/", "get_hovercode", ("abc",), {}),
+        (responses.GET, "hovercode/abc/activity/", "get_activity", ("abc",), {}),
+        (
+            responses.PUT,
+            "hovercode/abc/update/",
+            "update",
+            ("abc",),
+            {"display_name": "x"},
+        ),
+        (
+            responses.POST,
+            "hovercode/abc/tags/add/",
+            "add_tags",
+            ("abc", [TagInput(title="t")]),
+            {},
+        ),
+        (responses.DELETE, "hovercode/abc/delete/", "delete_hovercode", ("abc",), {}),
+    ],
+)
 @responses.activate
-def test_delete_raises_on_non_object_response() -> None:
-    """delete() should raise on unexpected response types."""
+def test_methods_raise_on_non_object_response(
+    verb: str, path: str, method: str, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> None:
+    """Every endpoint method should reject non-object JSON responses."""
 
     client = HovercodesClient(api_token="t")
-    url = "https://hovercode.com/api/v2/hovercode/abc/delete/"
-    responses.add(responses.DELETE, url, json=["no"], status=200)
+    responses.add(verb, f"https://hovercode.com/api/v2/{path}", json=["no"], status=200)
 
-    with pytest.raises(ValidationError):
-        client.delete_hovercode("abc")
+    with pytest.raises(ValidationError) as exc:
+        getattr(client, method)(*args, **kwargs)
+    assert str(exc.value).startswith(f"Unexpected response type from {method}().")
+    assert exc.value.response_data == ["no"]
 
 
 def test_normalize_str_enum_rejects_non_str_enum_value() -> None:
@@ -373,3 +548,36 @@ def test_normalize_str_enum_rejects_non_str_enum_value() -> None:
 
     with pytest.raises(ValidationError):
         _normalize_str_enum(Bad.X)
+
+
+def test_normalize_str_enum_passes_through_str_subclasses() -> None:
+    """Non-Enum str subclasses should be returned unchanged."""
+
+    class Tagged(str):
+        """Plain str subclass for testing."""
+
+    value = Tagged("burst")
+    assert _normalize_str_enum(value) is value
+
+
+def test_normalize_str_enum_memoizes_results() -> None:
+    """Repeated enum normalization should hit the cache; strings bypass it."""
+
+    _normalize_cached.cache_clear()
+    assert _normalize_str_enum(Frame.BURST) == "burst"
+    assert _normalize_str_enum(Frame.BURST) == "burst"
+    assert _normalize_str_enum("burst") == "burst"
+    info = _normalize_cached.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_import_does_not_load_enum_or_model_modules() -> None:
+    """Importing the resource module should defer enums/models until needed."""
+
+    code = (
+        "import sys\n"
+        "import hovercode.hovercodes\n"
+        "assert 'hovercode.enums' not in sys.modules\n"
+        "assert 'hovercode.models' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # nosec B603
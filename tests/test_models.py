@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 import pytest
 
 from hovercode.exceptions import ValidationError
@@ -54,33 +56,20 @@ def test_paginated_response_from_dict_success() -> None:
     assert parsed.to_dict() == data
 
 
-def test_paginated_response_from_dict_invalid_count() -> None:
-    """PaginatedResponse should validate count type."""
-
-    data = {"count": "no", "next": None, "previous": None, "results": []}
-    with pytest.raises(ValidationError):
-        PaginatedResponse.from_dict(data)
-
-
-def test_paginated_response_from_dict_invalid_next_previous() -> None:
-    """PaginatedResponse should validate next/previous types."""
-
-    data = {"count": 0, "next": 123, "previous": None, "results": []}
-    with pytest.raises(ValidationError):
-        PaginatedResponse.from_dict(data)
-
-    data2 = {"count": 0, "next": None, "previous": 123, "results": []}
-    with pytest.raises(ValidationError):
-        PaginatedResponse.from_dict(data2)
-
-
-def test_paginated_response_from_dict_invalid_results_shape() -> None:
-    """PaginatedResponse should validate results list contents."""
-
-    data = {"count": 1, "next": None, "previous": None, "results": "nope"}
-    with pytest.raises(ValidationError):
-        PaginatedResponse.from_dict(data)
-
-    data2 = {"count": 1, "next": None, "previous": None, "results": ["bad"]}
-    with pytest.raises(ValidationError):
-        PaginatedResponse.from_dict(data2)
+@pytest.mark.parametrize(
+    "bad",
+    [
+        {"count": "no", "next": None, "previous": None, "results": []},
+        {"count": 0, "next": 123, "previous": None, "results": []},
+        {"count": 0, "next": None, "previous": 123, "results": []},
+        {"count": 1, "next": None, "previous": None, "results": "nope"},
+        {"count": 1, "next": None, "previous": None, "results": ["bad"]},
+    ],
+    ids=["count", "next", "previous", "results-type", "results-item"],
+)
+def test_paginated_response_from_dict_invalid(bad: dict[str, Any]) -> None:
+    """PaginatedResponse should reject each malformed field with the payload."""
+
+    with pytest.raises(ValidationError) as exc:
+        PaginatedResponse.from_dict(bad)
+    assert exc.value.response_data == bad
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import subprocess  # nosec B404
+import sys
+
+import pytest
+
 import hovercode
 
 
@@ -11,3 +16,36 @@ def test_package_exports_version_and_client() -> None:
     assert isinstance(hovercode.__version__, str)
     assert hovercode.__version__ == "0.1.1"
     assert hovercode.HovercodeClient is not None
+
+
+def test_lazy_exports_resolve_and_are_cached() -> None:
+    """Lazily exported names should resolve to the submodule objects."""
+
+    from hovercode.enums import QrType
+
+    assert hovercode.QrType is QrType
+    assert vars(hovercode)["QrType"] is QrType
+    assert set(hovercode.__all__) <= set(dir(hovercode))
+
+
+def test_unknown_attribute_raises_attribute_error() -> None:
+    """Unknown names should raise AttributeError."""
+
+    with pytest.raises(AttributeError):
+        getattr(hovercode, "DoesNotExist")
+
+
+def test_submodules_resolve_as_attributes() -> None:
+    """Submodules should be reachable as attributes without an explicit import."""
+
+    import hovercode.webhooks
+
+    assert hovercode.__getattr__("webhooks") is hovercode.webhooks
+    assert "exceptions" in dir(hovercode)
+
+    code = (
+        "import hovercode\n"
+        "assert hovercode.exceptions.ApiError.__name__ == 'ApiError'\n"
+        "assert hovercode.enums.QrType.LINK == 'Link'\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # nosec B603
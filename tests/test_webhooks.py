@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-import hashlib
 import hmac
+import io
+from typing import Callable
 
 import pytest
 
@@ -12,37 +13,71 @@ from hovercode.webhooks import (
     compute_signature,
     verify_signature,
     verify_signature_or_raise,
+    verify_signature_stream,
 )
 
 
 def test_compute_signature_matches_hmac_sha256() -> None:
-    """compute_signature should return hex HMAC-SHA256."""
+    """compute_signature should return hex HMAC-SHA256 (known-answer vector)."""
 
-    secret = "secret"
+    # printf '%s' '{"hello":"world"}' | openssl dgst -sha256 -hmac secret
+    expected = "2677ad3e7c090b2fa2c0fb13020d66d5420879b8316eb356a2d60fb9073bc778"
     payload = b'{"hello":"world"}'
+    assert compute_signature(secret="secret", raw_payload=payload) == expected
+
+
+@pytest.mark.parametrize(
+    ("mutate", "expected"),
+    [
+        (lambda sig: sig, True),
+        (lambda sig: f" {sig} ", True),
+        (lambda sig: sig.upper(), True),
+        (lambda sig: "nope", False),
+        (lambda sig: "00" * 32, False),
+        (lambda sig: "é" * 64, False),
+        (lambda sig: f"{sig[:2]} {sig[2:]}", False),
+        (lambda sig: sig[:-2], False),
+    ],
+    ids=[
+        "exact",
+        "whitespace",
+        "upper-hex",
+        "non-hex",
+        "wrong-digest",
+        "non-ascii",
+        "inner-whitespace",
+        "truncated",
+    ],
+)
+def test_verify_signature(mutate: Callable[[str], str], expected: bool) -> None:
+    """verify_signature should accept only the matching digest, in any hex case."""
 
-    expected = hmac.new(secret.encode("utf-8"), payload, hashlib.sha256).hexdigest()
-    assert compute_signature(secret=secret, raw_payload=payload) == expected
-
+    sig = compute_signature(secret="secret", raw_payload=b"abc")
+    received = mutate(sig)
+    assert (
+        verify_signature(
+            secret="secret", raw_payload=b"abc", received_signature=received
+        )
+        is expected
+    )
 
-def test_verify_signature_true_and_strips_whitespace() -> None:
-    """verify_signature should return True on matching signature."""
 
-    secret = "secret"
-    payload = b"abc"
-    sig = compute_signature(secret=secret, raw_payload=payload)
-    assert verify_signature(
-        secret=secret, raw_payload=payload, received_signature=f" {sig} "
-    )
+def test_verify_signature_uses_constant_time_compare(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Signature checks should go through hmac.compare_digest on raw digests."""
 
+    seen: list[tuple[bytes, bytes]] = []
+    real_compare = hmac.compare_digest
 
-def test_verify_signature_false() -> None:
-    """verify_signature should return False on mismatch."""
+    def _compare(a: bytes, b: bytes) -> bool:
+        seen.append((a, b))
+        return real_compare(a, b)
 
-    assert (
-        verify_signature(secret="s", raw_payload=b"x", received_signature="nope")
-        is False
-    )
+    monkeypatch.setattr("hovercode.webhooks.hmac.compare_digest", _compare)
+    sig = compute_signature(secret="s", raw_payload=b"x")
+    assert verify_signature(secret="s", raw_payload=b"x", received_signature=sig)
+    assert seen == [(bytes.fromhex(sig), bytes.fromhex(sig))]
 
 
 def test_verify_signature_or_raise() -> None:
@@ -60,3 +95,24 @@ def test_verify_signature_or_raise() -> None:
         verify_signature_or_raise(
             secret=secret, raw_payload=payload, received_signature="wrong"
         )
+
+
+def test_verify_signature_stream_matches_single_shot() -> None:
+    """verify_signature_stream should agree with verify_signature across chunks."""
+
+    secret = "secret"
+    payload = b"x" * 1000
+    sig = compute_signature(secret=secret, raw_payload=payload)
+
+    assert verify_signature_stream(
+        secret=secret,
+        stream=io.BytesIO(payload),
+        received_signature=f" {sig}\n",
+        chunk_size=64,
+    )
+    assert (
+        verify_signature_stream(
+            secret=secret, stream=io.BytesIO(payload), received_signature="nope"
+        )
+        is False
+    )